@@ -1,3 +1,4 @@
 from .tmdb import TMDbClient
 from .merged import get_merged_details
+from .wikipedia import clear_wikipedia_cache
 from .attributes import compute_all_attributes
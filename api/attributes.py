@@ -3,20 +3,94 @@ Attribute auto-detection for Production Cost Estimator.
 Computes 5 attributes from TMDb movie data.
 """
 import os
-import json
+import re
+import functools
+
+import orjson
+
+try:
+    import ahocorasick
+except ImportError:  # optional; fall back to per-era regexes
+    ahocorasick = None
 
 # Load tier data
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
 
 
+# Period keywords, in priority order (an earlier era wins when several match)
+ERA_KEYWORDS = (
+    ("Historical (pre-1900)", (
+        "medieval", "ancient", "victorian", "1800s", "civil war",
+        "renaissance", "roman empire", "greek", "egyptian", "colonial",
+        "18th century", "17th century", "16th century",
+        "gladiator", "emperor", "rome", "roman", "viking", "samurai",
+        "pirate", "musketeer", "napoleon", "revolution",
+    )),
+    ("Period (1900-1980)", (
+        "world war", "wwi", "wwii", "1920s", "1930s", "1940s", "1950s",
+        "1960s", "1970s", "prohibition", "vietnam", "great depression",
+        "titanic", "1912", "1910s", "holocaust", "nazi",
+    )),
+    ("Recent Past (1980-2010)", (
+        "1980s", "1990s", "2000s", "cold war", "berlin wall", " 80s", " 90s",
+    )),
+    ("Futuristic", (
+        "future", "2100", "space station", "dystopia", "cyberpunk",
+        "post-apocalyptic", "year 20", "ai uprising", "android",
+        "spaceship", "interstellar", "galaxy", "alien planet",
+    )),
+)
+
+
+def _build_era_automaton():
+    """Build one Aho-Corasick automaton over all era keywords, valued by priority."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for priority, (_, keywords) in enumerate(ERA_KEYWORDS):
+        for kw in keywords:
+            if not automaton.exists(kw):
+                automaton.add_word(kw, priority)
+    automaton.make_automaton()
+    return automaton
+
+
+ERA_AUTOMATON = _build_era_automaton()
+
+# Fallback when pyahocorasick is unavailable: one alternation per era, checked in priority order
+ERA_PATTERNS = tuple(
+    (era, re.compile("|".join(map(re.escape, keywords))))
+    for era, keywords in ERA_KEYWORDS
+)
+
+
+def _read_json(path: str):
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+@functools.lru_cache(maxsize=1)
 def load_actor_tiers():
-    with open(os.path.join(DATA_DIR, "actor_tiers.json")) as f:
-        return json.load(f)
+    return _read_json(os.path.join(DATA_DIR, "actor_tiers.json"))
 
 
+@functools.lru_cache(maxsize=1)
 def load_studio_tiers():
-    with open(os.path.join(DATA_DIR, "studio_tiers.json")) as f:
-        return json.load(f)
+    return _read_json(os.path.join(DATA_DIR, "studio_tiers.json"))
+
+
+# Lowercased genre/job sets used by the VFX and action detectors
+HEAVY_VFX_GENRES = frozenset({"science fiction", "fantasy"})
+MODERATE_VFX_GENRES = frozenset({"action", "adventure"})
+PRACTICAL_GENRES = frozenset({"horror", "thriller"})
+ACTION_GENRES = frozenset({"action", "adventure", "war"})
+DIALOGUE_GENRES = frozenset({"drama", "comedy", "romance"})
+STUNT_JOBS = frozenset({"stunt coordinator", "stunt double", "fight choreographer"})
+
+# Actor name sets for star power detection, loaded once at import
+_ACTOR_TIERS = load_actor_tiers()["tiers"]
+A_LIST_ACTORS = frozenset(_ACTOR_TIERS["A-List"]["actors"])
+B_LIST_ACTORS = frozenset(_ACTOR_TIERS["B-List"]["actors"])
 
 
 def detect_period_era(overview: str, title: str = "") -> str:
@@ -26,75 +100,52 @@ def detect_period_era(overview: str, title: str = "") -> str:
     if not text.strip():
         return "Contemporary"
 
-    # Historical (pre-1900)
-    historical = ["medieval", "ancient", "victorian", "1800s", "civil war",
-                  "renaissance", "roman empire", "greek", "egyptian", "colonial",
-                  "18th century", "17th century", "16th century",
-                  "gladiator", "emperor", "rome", "roman", "viking", "samurai",
-                  "pirate", "musketeer", "napoleon", "revolution"]
-    if any(kw in text for kw in historical):
-        return "Historical (pre-1900)"
-
-    # Period (1900-1980)
-    period = ["world war", "wwi", "wwii", "1920s", "1930s", "1940s", "1950s",
-              "1960s", "1970s", "prohibition", "vietnam", "great depression",
-              "titanic", "1912", "1910s", "holocaust", "nazi"]
-    if any(kw in text for kw in period):
-        return "Period (1900-1980)"
-
-    # Recent Past (1980-2010)
-    recent = ["1980s", "1990s", "2000s", "cold war", "berlin wall", " 80s", " 90s"]
-    if any(kw in text for kw in recent):
-        return "Recent Past (1980-2010)"
-
-    # Futuristic
-    future = ["future", "2100", "space station", "dystopia", "cyberpunk",
-              "post-apocalyptic", "year 20", "ai uprising", "android",
-              "spaceship", "interstellar", "galaxy", "alien planet"]
-    if any(kw in text for kw in future):
-        return "Futuristic"
+    if ERA_AUTOMATON is None:
+        for era, pattern in ERA_PATTERNS:
+            if pattern.search(text):
+                return era
+        return "Contemporary"
 
+    # Single pass over the text; keep the highest-priority era that matched
+    best = len(ERA_KEYWORDS)
+    for _, priority in ERA_AUTOMATON.iter(text):
+        if priority < best:
+            best = priority
+            if best == 0:
+                break  # nothing outranks the first era
+
+    if best < len(ERA_KEYWORDS):
+        return ERA_KEYWORDS[best][0]
     return "Contemporary"
 
 
-def detect_vfx_intensity(genres: list, budget_raw: int) -> str:
-    """Detect VFX intensity from genres and budget."""
-    genre_set = set(g.lower() for g in (genres or []))
+def detect_vfx_intensity(genre_set: frozenset, budget_raw: int) -> str:
+    """Detect VFX intensity from lowercased genres and budget."""
     budget = budget_raw or 0
 
     # Animation is always Heavy (100% VFX)
     if "animation" in genre_set:
         return "Heavy"
 
-    heavy_genres = {"science fiction", "fantasy"}
-    moderate_genres = {"action", "adventure"}
-    practical_genres = {"horror", "thriller"}
-
-    if genre_set & heavy_genres and budget >= 100_000_000:
+    if genre_set & HEAVY_VFX_GENRES and budget >= 100_000_000:
         return "Heavy"
-    if genre_set & heavy_genres or genre_set & moderate_genres:
+    if genre_set & HEAVY_VFX_GENRES or genre_set & MODERATE_VFX_GENRES:
         return "Moderate"
-    if genre_set & practical_genres or budget < 10_000_000:
+    if genre_set & PRACTICAL_GENRES or budget < 10_000_000:
         return "Practical Only"
     return "Light"
 
 
-def detect_action_complexity(genres: list, crew_jobs: list) -> str:
-    """Detect action complexity from genre and crew."""
-    genre_set = set(g.lower() for g in (genres or []))
-    jobs = set(j.lower() for j in (crew_jobs or []))
-
-    action_genres = {"action", "adventure", "war"}
-    stunt_jobs = {"stunt coordinator", "stunt double", "fight choreographer"}
-
-    has_action_genre = bool(genre_set & action_genres)
-    has_stunt_crew = bool(jobs & stunt_jobs)
+def detect_action_complexity(genre_set: frozenset, job_set: frozenset) -> str:
+    """Detect action complexity from lowercased genres and crew jobs."""
+    has_action_genre = bool(genre_set & ACTION_GENRES)
+    has_stunt_crew = bool(job_set & STUNT_JOBS)
 
     if has_action_genre and has_stunt_crew:
         return "High"
     if has_action_genre or has_stunt_crew:
         return "Moderate"
-    if genre_set & {"drama", "comedy", "romance"}:
+    if genre_set & DIALOGUE_GENRES:
         return "Dialogue-Driven"
     return "Light"
 
@@ -118,15 +169,11 @@ def detect_production_scale(companies: list, budget_raw: int) -> str:
 
 def detect_star_power(cast_names: list) -> str:
     """Detect star power from cast names."""
-    tiers = load_actor_tiers()["tiers"]
-    a_list = set(tiers["A-List"]["actors"])
-    b_list = set(tiers["B-List"]["actors"])
-
     top_cast = (cast_names or [])[:5]
 
-    if any(name in a_list for name in top_cast[:3]):
+    if any(name in A_LIST_ACTORS for name in top_cast[:3]):
         return "A-List"
-    if any(name in b_list for name in top_cast):
+    if any(name in B_LIST_ACTORS for name in top_cast):
         return "B-List"
     if top_cast:
         return "Rising Stars"
@@ -136,11 +183,14 @@ def detect_star_power(cast_names: list) -> str:
 def compute_all_attributes(data: dict, crew_jobs: list = None) -> dict:
     """Compute all 5 auto-detectable attributes."""
     cast_names = [c["name"] for c in data.get("cast", [])]
+    # Normalize genres and crew jobs once for the genre/crew-based detectors
+    genre_set = frozenset(g.lower() for g in (data.get("genres") or []))
+    job_set = frozenset(j.lower() for j in (crew_jobs or []))
 
     return {
         "period": detect_period_era(data.get("overview"), data.get("title")),
-        "vfx": detect_vfx_intensity(data.get("genres"), data.get("budget_raw")),
-        "action": detect_action_complexity(data.get("genres"), crew_jobs),
+        "vfx": detect_vfx_intensity(genre_set, data.get("budget_raw")),
+        "action": detect_action_complexity(genre_set, job_set),
         "scale": detect_production_scale(data.get("production_companies"), data.get("budget_raw")),
         "star_power": detect_star_power(cast_names),
     }
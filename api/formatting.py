@@ -0,0 +1,11 @@
+def format_currency(amount: int) -> str:
+    """Format budget/revenue as readable currency."""
+    if amount is None or amount == 0:
+        return None
+    if amount >= 1_000_000_000:
+        return f"${amount / 1_000_000_000:.1f}B"
+    if amount >= 1_000_000:
+        return f"${amount / 1_000_000:.0f}M"
+    if amount >= 1_000:
+        return f"${amount / 1_000:.0f}K"
+    return f"${amount:,}"
@@ -1,19 +1,19 @@
 from .tmdb import TMDbClient, get_poster_url, get_profile_url
+from .formatting import format_currency
 from .wikipedia import get_budget_from_wikipedia
 from .attributes import compute_all_attributes
 
 
-def format_currency(amount: int) -> str:
-    """Format budget/revenue as readable currency."""
-    if amount is None or amount == 0:
-        return None
-    if amount >= 1_000_000_000:
-        return f"${amount / 1_000_000_000:.1f}B"
-    if amount >= 1_000_000:
-        return f"${amount / 1_000_000:.0f}M"
-    if amount >= 1_000:
-        return f"${amount / 1_000:.0f}K"
-    return f"${amount:,}"
+# Crew job -> result key for the roles we surface
+_JOB_MAPPING = {
+    "Director": "directors",
+    "Writer": "writers",
+    "Screenplay": "writers",
+    "Producer": "producers",
+    "Executive Producer": "producers",
+    "Original Music Composer": "composers",
+    "Director of Photography": "cinematographers",
+}
 
 
 def extract_crew(credits: dict) -> tuple[dict, list]:
@@ -27,25 +27,22 @@ def extract_crew(credits: dict) -> tuple[dict, list]:
         "cinematographers": [],
     }
 
-    job_mapping = {
-        "Director": "directors",
-        "Writer": "writers",
-        "Screenplay": "writers",
-        "Producer": "producers",
-        "Executive Producer": "producers",
-        "Original Music Composer": "composers",
-        "Director of Photography": "cinematographers",
-    }
+    # Per-key membership sets keep the de-duplication O(1) per crew member
+    seen = {key: set() for key in result}
 
     all_jobs = []
+    append_job = all_jobs.append
+    job_mapping_get = _JOB_MAPPING.get
     for person in crew:
-        job = person.get("job")
+        person_get = person.get
+        job = person_get("job")
         if job:
-            all_jobs.append(job)
-        if job in job_mapping:
-            key = job_mapping[job]
-            name = person.get("name")
-            if name and name not in result[key]:
+            append_job(job)
+        key = job_mapping_get(job)
+        if key is not None:
+            name = person_get("name")
+            if name and name not in seen[key]:
+                seen[key].add(name)
                 result[key].append(name)
 
     return result, all_jobs
@@ -64,6 +61,75 @@ def extract_cast(credits: dict, limit: int = 10) -> list:
     ]
 
 
+def _build_movie_result(tmdb_data: dict, common: dict, skip_wikipedia: bool) -> dict:
+    """Add the movie-only fields (financials with Wikipedia budget fallback)."""
+    release_date = common["release_date"]
+    year = release_date[:4] if release_date else None
+
+    # Get budget from TMDb
+    budget = tmdb_data.get("budget")
+    budget_formatted = format_currency(budget)
+    budget_source = "TMDb" if budget else None
+    budget_source_url = common["tmdb_url"] if budget else None
+
+    # Fallback to Wikipedia if TMDb budget is missing (unless skipped)
+    if not budget and not skip_wikipedia:
+        try:
+            wiki_data = get_budget_from_wikipedia(common["title"], year)
+            if wiki_data.get("budget_raw"):
+                budget = wiki_data["budget_raw"]
+                budget_formatted = wiki_data["budget"]
+                budget_source = "Wikipedia"
+                budget_source_url = wiki_data.get("url")
+        except Exception:
+            pass  # Silently fail Wikipedia lookup
+
+    revenue = tmdb_data.get("revenue")
+    return {
+        **common,
+        "original_title": tmdb_data.get("original_title"),
+        "runtime": tmdb_data.get("runtime"),
+
+        # Financials
+        "budget": budget_formatted,
+        "revenue": format_currency(revenue),
+        "budget_raw": budget,
+        "revenue_raw": revenue,
+        "budget_source": budget_source,
+        "budget_source_url": budget_source_url,
+
+        # TV specific
+        "number_of_seasons": None,
+        "number_of_episodes": None,
+        "networks": None,
+        "created_by": None,
+    }
+
+
+def _build_tv_result(tmdb_data: dict, common: dict) -> dict:
+    """Add the TV-only fields; financials are not available for TV."""
+    episode_run_time = tmdb_data.get("episode_run_time")
+    return {
+        **common,
+        "original_title": tmdb_data.get("original_name"),
+        "runtime": episode_run_time[0] if episode_run_time else None,
+
+        # Financials (movies only)
+        "budget": None,
+        "revenue": None,
+        "budget_raw": None,
+        "revenue_raw": None,
+        "budget_source": None,
+        "budget_source_url": None,
+
+        # TV specific
+        "number_of_seasons": tmdb_data.get("number_of_seasons"),
+        "number_of_episodes": tmdb_data.get("number_of_episodes"),
+        "networks": [n["name"] for n in tmdb_data.get("networks", [])],
+        "created_by": [c["name"] for c in tmdb_data.get("created_by", [])],
+    }
+
+
 def get_merged_details(
     tmdb_client: TMDbClient,
     tmdb_id: int,
@@ -81,14 +147,13 @@ def get_merged_details(
     tmdb_data = None
     credits = None
 
-    # Fetch TMDb data
+    # Details and credits come back together via append_to_response
     try:
         if media_type == "movie":
-            tmdb_data = tmdb_client.get_movie_details(tmdb_id)
-            credits = tmdb_client.get_movie_credits(tmdb_id)
+            tmdb_data = tmdb_client.get_movie_bundle(tmdb_id)
         else:  # tv
-            tmdb_data = tmdb_client.get_tv_details(tmdb_id)
-            credits = tmdb_client.get_tv_credits(tmdb_id)
+            tmdb_data = tmdb_client.get_tv_bundle(tmdb_id)
+        credits = tmdb_data.pop("credits", None)
     except Exception as e:
         errors.append(f"TMDb error: {str(e)}")
 
@@ -101,68 +166,27 @@ def get_merged_details(
 
     # Build result
     is_movie = media_type == "movie"
-    title = tmdb_data.get("title") if is_movie else tmdb_data.get("name")
     release_date = tmdb_data.get("release_date") if is_movie else tmdb_data.get("first_air_date")
-    year = release_date[:4] if release_date else None
-
-    # URLs for sources
-    tmdb_url = f"https://www.themoviedb.org/{media_type}/{tmdb_id}"
-    budget_source_url = None
-
-    # Get budget from TMDb
-    budget = tmdb_data.get("budget") if is_movie else None
-    budget_formatted = format_currency(budget)
-    budget_source = "TMDb" if budget else None
-    if budget:
-        budget_source_url = tmdb_url
-
-    # Fallback to Wikipedia if TMDb budget is missing (unless skipped)
-    if is_movie and not budget and not skip_wikipedia:
-        try:
-            wiki_data = get_budget_from_wikipedia(title, year)
-            if wiki_data.get("budget_raw"):
-                budget = wiki_data["budget_raw"]
-                budget_formatted = wiki_data["budget"]
-                budget_source = "Wikipedia"
-                budget_source_url = wiki_data.get("url")
-        except Exception:
-            pass  # Silently fail Wikipedia lookup
 
-    result = {
+    common = {
         # Basic info
-        "title": title,
-        "original_title": tmdb_data.get("original_title") if is_movie else tmdb_data.get("original_name"),
+        "title": tmdb_data.get("title") if is_movie else tmdb_data.get("name"),
         "overview": tmdb_data.get("overview"),
         "poster_url": get_poster_url(tmdb_data.get("poster_path")),
         "release_date": release_date,
         "genres": [g["name"] for g in tmdb_data.get("genres", [])],
-        "runtime": tmdb_data.get("runtime") if is_movie else (tmdb_data.get("episode_run_time", [None])[0] if tmdb_data.get("episode_run_time") else None),
         "status": tmdb_data.get("status"),
         "original_language": tmdb_data.get("original_language"),
         "production_countries": [c["name"] for c in tmdb_data.get("production_countries", [])],
         "production_companies": [c["name"] for c in tmdb_data.get("production_companies", [])],
         "media_type": media_type,
         "tmdb_id": tmdb_id,
-
-        # Financials (movies only)
-        "budget": budget_formatted,
-        "revenue": format_currency(tmdb_data.get("revenue")) if is_movie else None,
-        "budget_raw": budget,
-        "revenue_raw": tmdb_data.get("revenue") if is_movie else None,
-        "budget_source": budget_source,
-        "budget_source_url": budget_source_url,
-        "tmdb_url": tmdb_url,
+        "tmdb_url": f"https://www.themoviedb.org/{media_type}/{tmdb_id}",
 
         # Ratings (TMDb)
         "vote_average": tmdb_data.get("vote_average"),
         "vote_count": tmdb_data.get("vote_count"),
 
-        # TV specific
-        "number_of_seasons": tmdb_data.get("number_of_seasons") if not is_movie else None,
-        "number_of_episodes": tmdb_data.get("number_of_episodes") if not is_movie else None,
-        "networks": [n["name"] for n in tmdb_data.get("networks", [])] if not is_movie else None,
-        "created_by": [c["name"] for c in tmdb_data.get("created_by", [])] if not is_movie else None,
-
         # Crew and cast
         "directors": crew.get("directors", []),
         "writers": crew.get("writers", []),
@@ -172,6 +196,11 @@ def get_merged_details(
         "cast": cast,
     }
 
+    if is_movie:
+        result = _build_movie_result(tmdb_data, common, skip_wikipedia)
+    else:
+        result = _build_tv_result(tmdb_data, common)
+
     # Compute auto-detected attributes
     computed = compute_all_attributes(result, crew_jobs)
     result.update({
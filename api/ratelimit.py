@@ -0,0 +1,28 @@
+import threading
+import time
+from collections import deque
+
+
+class RateLimiter:
+    """Thread-safe rolling-window limiter allowing `max_calls` requests per `period` seconds."""
+
+    def __init__(self, max_calls: int, period: float):
+        self.period = period
+        # Start times of the last max_calls requests; queued callers hold future slots
+        self.calls = deque(maxlen=max_calls)
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block only while the window is full, then record the request."""
+        with self.lock:
+            now = time.monotonic()
+            start = now
+            if len(self.calls) == self.calls.maxlen:
+                start = max(now, self.calls[0] + self.period)
+            self.calls.append(start)
+        if start > now:
+            time.sleep(start - now)
+
+
+# TMDb allows 40 requests per 10 seconds; scripts share this one budget
+TMDB_LIMITER = RateLimiter(40, 10)
@@ -1,9 +1,30 @@
-import requests
+import os
+from datetime import timedelta
+
+import orjson
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 TMDB_IMAGE_BASE = "https://image.tmdb.org/t/p/"
 POSTER_SIZE = "w500"
 PROFILE_SIZE = "w185"
 
+# On-disk HTTP response cache shared by the API clients
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache")
+
+
+def mount_pooled_adapter(session):
+    """Mount a keep-alive connection pool with retries on transient errors."""
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 def get_poster_url(poster_path: str) -> str | None:
     """Construct full poster URL from TMDb path."""
@@ -24,14 +45,29 @@ class TMDbClient:
 
     def __init__(self, api_key: str):
         self.api_key = api_key
+        # Pooled keep-alive session so repeated calls reuse the TLS connection.
+        # Responses are cached on disk. Details are kept for a week so revenue and
+        # cast of titles still in release catch up; search results must show newly
+        # added titles and discover listings reorder by popularity, so both expire
+        # sooner. Expired entries are revalidated with If-None-Match and reused on a 304.
+        self.session = requests_cache.CachedSession(
+            os.path.join(CACHE_DIR, "tmdb"),
+            backend="sqlite",
+            expire_after=timedelta(days=7),
+            urls_expire_after={
+                "api.themoviedb.org/3/search/*": timedelta(hours=1),
+                "api.themoviedb.org/3/discover/*": timedelta(days=1),
+            },
+            allowable_codes=(200,),
+        )
+        self.session.params = {"api_key": api_key}
+        mount_pooled_adapter(self.session)
 
     def _get(self, endpoint: str, params: dict = None) -> dict:
         """Make a GET request to TMDb API."""
-        params = params or {}
-        params["api_key"] = self.api_key
-        response = requests.get(f"{self.BASE_URL}{endpoint}", params=params, timeout=30)
+        response = self.session.get(f"{self.BASE_URL}{endpoint}", params=params, timeout=30)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     def search_multi(self, query: str) -> list:
         """Search movies, TV shows, and people."""
@@ -48,6 +84,10 @@ class TMDbClient:
         """Get movie cast and crew."""
         return self._get(f"/movie/{tmdb_id}/credits")
 
+    def get_movie_bundle(self, tmdb_id: int) -> dict:
+        """Get movie details with credits appended, in a single request."""
+        return self._get(f"/movie/{tmdb_id}", {"append_to_response": "credits"})
+
     def get_tv_details(self, tmdb_id: int) -> dict:
         """Get TV show details."""
         return self._get(f"/tv/{tmdb_id}")
@@ -56,6 +96,10 @@ class TMDbClient:
         """Get TV show cast and crew."""
         return self._get(f"/tv/{tmdb_id}/credits")
 
+    def get_tv_bundle(self, tmdb_id: int) -> dict:
+        """Get TV show details with credits appended, in a single request."""
+        return self._get(f"/tv/{tmdb_id}", {"append_to_response": "credits"})
+
     def get_external_ids(self, tmdb_id: int, media_type: str) -> dict:
         """Get external IDs (IMDb, etc.) for a movie or TV show."""
         return self._get(f"/{media_type}/{tmdb_id}/external_ids")
@@ -1,11 +1,55 @@
+import functools
+import os
 import re
-import requests
-from bs4 import BeautifulSoup
+import string
+from datetime import timedelta
 
+import orjson
+import requests_cache
+from lxml import html as lxml_html
 
+from .tmdb import CACHE_DIR, mount_pooled_adapter
+
+
+API_URL = "https://en.wikipedia.org/w/api.php"
 HEADERS = {"User-Agent": "MovieInfoApp/1.0 (https://github.com/example; contact@example.com)"}
 
 
+@functools.lru_cache(maxsize=None)
+def _get_session():
+    """Cached session for search and page fetches, created on first use; infoboxes change rarely."""
+    session = requests_cache.CachedSession(
+        os.path.join(CACHE_DIR, "wikipedia"),
+        backend="sqlite",
+        expire_after=timedelta(days=7),
+        allowable_codes=(200,),
+    )
+    return mount_pooled_adapter(session)
+
+
+def clear_wikipedia_cache():
+    """Drop stored Wikipedia responses so the next lookup refetches them."""
+    _get_session().cache.clear()
+
+
+# Budget parsing patterns, compiled once
+_BUDGET_UNIT_RE = re.compile(r"\$?([\d.]+)\s*(million|billion|mil|bil)")
+_BUDGET_INT_RE = re.compile(r"\$?([\d]+)")
+_FOOTNOTE_RE = re.compile(r"\[.*?\]")
+
+# First infobox row whose header mentions "budget" (the budget row)
+_BUDGET_ROW_XPATH = (
+    '(//table[contains(concat(" ", normalize-space(@class), " "), " infobox ")])[1]'
+    '//tr[contains(translate((.//th)[1], "BUDGET", "budget"), "budget")]'
+)
+
+# Lowercases and strips thousands separators/spaces from budget text in one pass
+_BUDGET_CLEAN = str.maketrans(string.ascii_uppercase, string.ascii_lowercase, ", ")
+
+# Percent-encodes the characters that break a text fragment URL
+_FRAGMENT_QUOTE = str.maketrans({" ": "%20", "$": "%24"})
+
+
 def search_wikipedia(title: str, year: str = None) -> str | None:
     """Search Wikipedia and return the page URL for a movie/TV show."""
     search_query = f"{title} {year} film" if year else f"{title} film"
@@ -19,8 +63,8 @@ def search_wikipedia(title: str, year: str = None) -> str | None:
         "srlimit": 5
     }
 
-    response = requests.get("https://en.wikipedia.org/w/api.php", params=params, headers=HEADERS, timeout=10)
-    data = response.json()
+    response = _get_session().get(API_URL, params=params, headers=HEADERS, timeout=10)
+    data = orjson.loads(response.content)
 
     results = data.get("query", {}).get("search", [])
     if not results:
@@ -48,36 +92,45 @@ def get_budget_from_wikipedia(title: str, year: str = None) -> dict:
         if not page_title:
             return result
 
-        # Fetch the page content
         url = f"https://en.wikipedia.org/wiki/{page_title.replace(' ', '_')}"
-        response = requests.get(url, headers=HEADERS, timeout=10)
+
+        # Fetch only the lead section, which holds the infobox, instead of the whole article
+        params = {
+            "action": "parse",
+            "page": page_title,
+            "prop": "text",
+            "section": 0,
+            "redirects": 1,
+            "format": "json",
+            "formatversion": 2,
+        }
+        response = _get_session().get(API_URL, params=params, headers=HEADERS, timeout=10)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        lead_html = orjson.loads(response.content).get("parse", {}).get("text")
+        if not lead_html:
+            return result
+
+        tree = lxml_html.fromstring(lead_html)
 
-        # Find the infobox
-        infobox = soup.find("table", class_="infobox")
-        if not infobox:
+        # Jump straight to the budget row of the infobox
+        rows = tree.xpath(_BUDGET_ROW_XPATH)
+        if not rows:
             return result
 
-        # Look for budget row
-        for row in infobox.find_all("tr"):
-            header = row.find("th")
-            if header and "budget" in header.get_text().lower():
-                value_cell = row.find("td")
-                if value_cell:
-                    budget_text = value_cell.get_text(strip=True)
-                    parsed = parse_budget(budget_text)
-                    if parsed:
-                        result["budget"] = format_budget(parsed)
-                        result["budget_raw"] = parsed
-                        result["source"] = "Wikipedia"
-                        # Create URL with text fragment to highlight budget
-                        # Extract clean budget text for highlighting (remove footnotes)
-                        clean_budget = re.sub(r'\[.*?\]', '', budget_text).strip()
-                        highlight_text = clean_budget.replace(' ', '%20').replace('$', '%24')
-                        result["url"] = f"{url}#:~:text={highlight_text}"
-                break
+        value_cells = rows[0].xpath("(.//td)[1]")
+        if value_cells:
+            budget_text = _cell_text(value_cells[0])
+            parsed = parse_budget(budget_text)
+            if parsed:
+                result["budget"] = format_budget(parsed)
+                result["budget_raw"] = parsed
+                result["source"] = "Wikipedia"
+                # Create URL with text fragment to highlight budget
+                # Extract clean budget text for highlighting (remove footnotes)
+                clean_budget = _FOOTNOTE_RE.sub('', budget_text).strip()
+                highlight_text = clean_budget.translate(_FRAGMENT_QUOTE)
+                result["url"] = f"{url}#:~:text={highlight_text}"
 
         return result
 
@@ -85,19 +138,25 @@ def get_budget_from_wikipedia(title: str, year: str = None) -> dict:
         return result
 
 
+def _cell_text(cell) -> str:
+    """Join the stripped text nodes of a table cell, skipping inline styles/scripts."""
+    parts = cell.xpath(".//text()[not(ancestor::style) and not(ancestor::script)]")
+    return "".join(part.strip() for part in parts)
+
+
 def parse_budget(text: str) -> int | None:
     """Parse budget text like '$185 million' or '$185,000,000' into integer."""
     if not text:
         return None
 
     # Clean the text
-    text = text.lower().replace(",", "").replace(" ", "")
+    text = text.translate(_BUDGET_CLEAN)
 
     # Try to find dollar amounts
     # Pattern: $XXX million/billion or $XXX,XXX,XXX
 
     # Match patterns like $185million, $1.5billion
-    match = re.search(r"\$?([\d.]+)\s*(million|billion|mil|bil)", text)
+    match = _BUDGET_UNIT_RE.search(text)
     if match:
         number = float(match.group(1))
         unit = match.group(2)
@@ -107,7 +166,7 @@ def parse_budget(text: str) -> int | None:
             return int(number * 1_000_000)
 
     # Match patterns like $185000000
-    match = re.search(r"\$?([\d]+)", text)
+    match = _BUDGET_INT_RE.search(text)
     if match:
         number = int(match.group(1))
         if number > 10000:  # Likely a real budget amount
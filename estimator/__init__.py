@@ -1 +1 @@
-from .inflation import adjust_for_inflation, get_inflation_multiplier, format_currency
+from .inflation import adjust_for_inflation, adjust_for_inflation_bulk, get_inflation_multiplier, format_currency
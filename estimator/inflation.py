@@ -2,6 +2,9 @@
 Inflation adjustment for historical movie budgets.
 Uses CPI data from Bureau of Labor Statistics.
 """
+from functools import lru_cache
+
+import numpy as np
 
 # CPI data (annual averages, normalized to 2024 = 100)
 # Source: Bureau of Labor Statistics, Consumer Price Index
@@ -18,6 +21,16 @@ CPI_DATA = {
     2025: 102.5, 2026: 105.0,  # Projected
 }
 
+# Same CPI series as a contiguous list indexed by (year - CPI_BASE_YEAR), so a
+# range check replaces dict misses; CPI_ARR is the numpy copy for bulk adjustment
+CPI_BASE_YEAR = min(CPI_DATA)
+CPI_MAX_YEAR = max(CPI_DATA)
+CPI_LIST = [CPI_DATA[y] for y in range(CPI_BASE_YEAR, CPI_MAX_YEAR + 1)]
+CPI_ARR = np.array(CPI_LIST, dtype=np.float64)
+
+# Multipliers into 2024 dollars (the default target), precomputed once, same indexing
+MULT_TO_2024 = [CPI_DATA[2024] / cpi for cpi in CPI_LIST]
+
 
 def adjust_for_inflation(amount: int, from_year: int, to_year: int = 2024) -> int:
     """
@@ -35,16 +48,37 @@ def adjust_for_inflation(amount: int, from_year: int, to_year: int = 2024) -> in
         return amount
 
     # Handle years outside our data range
-    from_cpi = CPI_DATA.get(from_year)
-    to_cpi = CPI_DATA.get(to_year)
-
-    if not from_cpi or not to_cpi:
+    if not (CPI_BASE_YEAR <= from_year <= CPI_MAX_YEAR and CPI_BASE_YEAR <= to_year <= CPI_MAX_YEAR):
         return amount
 
-    multiplier = to_cpi / from_cpi
+    if to_year == 2024:
+        return int(amount * MULT_TO_2024[from_year - CPI_BASE_YEAR])
+
+    multiplier = CPI_LIST[to_year - CPI_BASE_YEAR] / CPI_LIST[from_year - CPI_BASE_YEAR]
     return int(amount * multiplier)
 
 
+def adjust_for_inflation_bulk(amounts, years, to_year: int = 2024) -> np.ndarray:
+    """
+    Vectorized adjust_for_inflation over parallel arrays of amounts and years.
+
+    Amounts whose year is outside the CPI range are returned unchanged, as in
+    the scalar version.
+    """
+    amounts = np.asarray(amounts, dtype=np.int64)
+    years = np.asarray(years, dtype=np.int64)
+
+    to_idx = to_year - CPI_BASE_YEAR
+    if not 0 <= to_idx < len(CPI_ARR):
+        return amounts.copy()
+
+    idx = years - CPI_BASE_YEAR
+    valid = (idx >= 0) & (idx < len(CPI_ARR))
+    multipliers = CPI_ARR[to_idx] / CPI_ARR[np.where(valid, idx, 0)]
+    adjusted = np.trunc(amounts * multipliers).astype(np.int64)
+    return np.where(valid, adjusted, amounts)
+
+
 def get_inflation_multiplier(from_year: int, to_year: int = 2024) -> float:
     """
     Get the inflation multiplier between two years.
@@ -56,23 +90,32 @@ def get_inflation_multiplier(from_year: int, to_year: int = 2024) -> float:
     Returns:
         Multiplier to convert from_year dollars to to_year dollars
     """
-    from_cpi = CPI_DATA.get(from_year)
-    to_cpi = CPI_DATA.get(to_year)
-
-    if not from_cpi or not to_cpi:
+    if not (CPI_BASE_YEAR <= from_year <= CPI_MAX_YEAR and CPI_BASE_YEAR <= to_year <= CPI_MAX_YEAR):
         return 1.0
 
-    return to_cpi / from_cpi
+    if to_year == 2024:
+        return MULT_TO_2024[from_year - CPI_BASE_YEAR]
+
+    return CPI_LIST[to_year - CPI_BASE_YEAR] / CPI_LIST[from_year - CPI_BASE_YEAR]
+
+
+# (divisor, format spec, suffix) by thousands group: K, M, then B for anything larger
+_CURRENCY_UNITS = (
+    (1_000, ".0f", "K"),
+    (1_000_000, ".0f", "M"),
+    (1_000_000_000, ".1f", "B"),
+)
 
 
+# typed=True so that e.g. 5 and 5.0, which format differently, get separate entries
+@lru_cache(maxsize=512, typed=True)
 def format_currency(amount: int) -> str:
     """Format budget as readable currency string."""
     if not amount:
         return "N/A"
-    if amount >= 1_000_000_000:
-        return f"${amount / 1_000_000_000:.1f}B"
-    if amount >= 1_000_000:
-        return f"${amount / 1_000_000:.0f}M"
-    if amount >= 1_000:
-        return f"${amount / 1_000:.0f}K"
-    return f"${amount:,}"
+    if not amount >= 1_000:
+        return f"${amount:,}"
+    # Pick the unit from the digit count (capped at billions) instead of testing each threshold
+    group = (len(str(int(min(amount, 1_000_000_000)))) - 1) // 3 - 1
+    divisor, spec, suffix = _CURRENCY_UNITS[group]
+    return f"${amount / divisor:{spec}}{suffix}"
@@ -1,34 +1,114 @@
-import os
+import html
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
-import streamlit.components.v1 as components
 from dotenv import load_dotenv
 from streamlit_searchbox import st_searchbox
-from api import TMDbClient, get_merged_details
+from api import TMDbClient, clear_wikipedia_cache, get_merged_details
+from shared import get_secret, hash_key, get_tmdb_client, inject_analytics, render_feedback_bar
 
 load_dotenv()
 
 st.set_page_config(page_title="Title Search", page_icon="🔍", layout="wide")
 
-# Google Analytics
-GA_TRACKING_CODE = """
-<!-- Google tag (gtag.js) -->
-<script async src="https://www.googletagmanager.com/gtag/js?id=G-7J88HTR1H2"></script>
-<script>
-  window.dataLayer = window.dataLayer || [];
-  function gtag(){dataLayer.push(arguments);}
-  gtag('js', new Date());
-  gtag('config', 'G-7J88HTR1H2');
-</script>
+inject_analytics("title_search")
+
+# Only query TMDb once typing pauses, and not for single characters
+SEARCH_DEBOUNCE_MS = 250
+MIN_QUERY_LENGTH = 2
+MAX_SEARCH_RESULTS = 10
+PREFIX_CACHE_SIZE = 64
+PREFETCH_COUNT = 3
+
+
+@st.cache_data(ttl=3600, max_entries=512, show_spinner=False)
+def cached_search(_client: TMDbClient, key_hash: str, query: str) -> list:
+    """Search TMDb once per query and build the dropdown (label, payload) options."""
+    options = []
+    for item in _client.search_multi(query)[:MAX_SEARCH_RESULTS]:
+        media_type = item.get("media_type", "movie")
+        title_text = item.get("title") or item.get("name", "Unknown")
+        year = (item.get("release_date") or item.get("first_air_date") or "")[:4]
+        type_icon = "🎬" if media_type == "movie" else "📺"
+        label = f"{type_icon} {title_text} ({year})" if year else f"{type_icon} {title_text}"
+        options.append((label, {"tmdb_id": item["id"], "media_type": media_type}))
+    return options
+
+
+class DetailsUnavailable(Exception):
+    """TMDb details could not be fetched; raised so the failure is not cached."""
+
+    def __init__(self, errors: list):
+        super().__init__(*errors)
+        self.errors = errors
+
+
+@st.cache_data(ttl=86400, max_entries=256, show_spinner=False)
+def cached_merged_details(_client: TMDbClient, key_hash: str, tmdb_id: int, media_type: str):
+    """Fetch merged details once per title; reruns reuse the cached result."""
+    data, errors = get_merged_details(_client, tmdb_id, media_type)
+    if data is None:
+        # Streamlit does not cache exceptions, so a transient TMDb error is retried next time
+        raise DetailsUnavailable(errors)
+    return data, errors
+
+
+@st.cache_resource
+def _prefetch_pool() -> ThreadPoolExecutor:
+    """Shared worker pool for warming the details cache in the background."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="tmdb-prefetch")
+
+
+ATTR_STYLES = """
+<style>
+.attr-grid { display: grid; grid-template-columns: repeat(5, 1fr); gap: 10px; margin: 10px 0; }
+.attr-card { background: #f0f2f6; border-radius: 8px; padding: 12px; text-align: center; }
+.attr-label { font-size: 11px; color: #666; text-transform: uppercase; margin-bottom: 4px; }
+.attr-value { font-size: 14px; font-weight: 600; color: #1e3a5f; }
+.attr-reason { font-size: 10px; color: #888; margin-top: 4px; }
+</style>
 """
-components.html(GA_TRACKING_CODE, height=0)
 
+ATTR_CARD = '<div class="attr-card"><div class="attr-label">{}</div><div class="attr-value">{}</div><div class="attr-reason">{}</div></div>'
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _render_computed_attrs_html(period, vfx, action, scale, star, genres, budget_raw, cast_names) -> str:
+    """Build the Computed Attributes card grid once per title; reruns reuse the HTML."""
+    parts = ['<div class="attr-grid">']
+
+    # Period
+    period_reason = "from plot keywords" if period != "Contemporary" else "default (modern setting)"
+    parts.append(ATTR_CARD.format("Period", period, period_reason))
 
-def get_secret(key: str, default: str = "") -> str:
-    """Get secret from st.secrets (Streamlit Cloud) or environment (local dev)."""
-    try:
-        return st.secrets[key]
-    except (KeyError, FileNotFoundError, AttributeError):
-        return os.getenv(key, default)
+    # VFX
+    vfx_genres = [g for g in genres if g.lower() in ["science fiction", "fantasy", "animation", "action", "adventure"]]
+    vfx_reason = f"genres: {', '.join(vfx_genres[:2])}" if vfx_genres else "based on genre mix"
+    parts.append(ATTR_CARD.format("VFX Level", vfx, vfx_reason))
+
+    # Action
+    action_genres = [g for g in genres if g.lower() in ["action", "adventure", "war", "drama", "comedy"]]
+    action_reason = f"genre: {action_genres[0]}" if action_genres else "from crew data"
+    parts.append(ATTR_CARD.format("Action", action, action_reason))
+
+    # Scale
+    if budget_raw and budget_raw > 0:
+        if budget_raw >= 1_000_000:
+            scale_reason = f"budget: ${budget_raw/1_000_000:.0f}M"
+        else:
+            scale_reason = f"budget: ${budget_raw/1_000:.0f}K"
+    else:
+        scale_reason = "no budget data"
+    scale_short = scale.split(" (")[0] if "(" in scale else scale
+    parts.append(ATTR_CARD.format("Scale", scale_short, scale_reason))
+
+    # Star Power
+    star_reason = f"cast: {cast_names[0]}" if cast_names else "no cast data"
+    parts.append(ATTR_CARD.format("Star Power", star, star_reason))
+
+    parts.append("</div>")
+    return "".join(parts)
 
 
 st.title("🔍 Title Search")
@@ -37,47 +117,159 @@ st.caption("Reference tool - search movie and TV show information from TMDb")
 # Sidebar
 with st.sidebar:
     st.caption("Data from [TMDb](https://www.themoviedb.org)")
+    if st.button("🔄 Refresh data"):
+        cached_search.clear()
+        cached_merged_details.clear()
+        # Per-session prefix results and prefetches would otherwise keep serving the old data
+        st.session_state.pop("search_cache", None)
+        st.session_state.pop("prefetching", None)
+        # The HTTP clients cache responses on disk too; without this the refetch gets the same data
+        api_key = get_secret("TMDB_API_KEY")
+        if api_key:
+            get_tmdb_client(api_key).session.cache.clear()
+        clear_wikipedia_cache()
+
+
+CAST_STYLES = """
+<style>
+.cast-row { display: flex; align-items: center; gap: 16px; margin-bottom: 10px; }
+.cast-row img, .cast-photo { width: 60px; flex-shrink: 0; border-radius: 4px; }
+</style>
+"""
+
+
+def _fold(text: str) -> str:
+    """Lowercase and strip accents, so "Amélie" matches "amelie" as it does on TMDb."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def _prefix_cache_lookup(query: str):
+    """Answer a query by re-ranking an earlier, complete result set for one of its prefixes."""
+    cache = st.session_state.setdefault("search_cache", OrderedDict())
+    for prefix, options in reversed(cache.items()):
+        # Only a short (untruncated) result set is guaranteed to contain every longer match
+        if query.startswith(prefix) and len(options) < MAX_SEARCH_RESULTS:
+            cache.move_to_end(prefix)
+            # TMDb also matches original and alternative titles that are not in the label,
+            # so keep every option and only move label matches to the front
+            folded = _fold(query)
+            return sorted(options, key=lambda opt: folded not in _fold(opt[0]))
+    return None
+
+
+def _prefix_cache_store(query: str, options: list):
+    cache = st.session_state.setdefault("search_cache", OrderedDict())
+    cache[query] = options
+    cache.move_to_end(query)
+    while len(cache) > PREFIX_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _prefetch_details(api_key: str, options: list):
+    """Fetch details for the top results in the background so the eventual click is instant."""
+    client, key_hash = get_tmdb_client(api_key), hash_key(api_key)
+    # Skip titles that are still being fetched from an earlier keystroke
+    pending = {k: f for k, f in st.session_state.get("prefetching", {}).items() if not f.done()}
+    for _, payload in options[:PREFETCH_COUNT]:
+        key = (payload["tmdb_id"], payload["media_type"])
+        if key not in pending:
+            pending[key] = _prefetch_pool().submit(cached_merged_details, client, key_hash, *key)
+    st.session_state["prefetching"] = pending
 
 
 def search_tmdb(query: str):
     """Search TMDb and return results for the searchbox dropdown."""
     # Get API key inside function to ensure it's available during callback
     api_key = get_secret("TMDB_API_KEY")
-    if not query or not api_key:
-        return []
-    try:
-        tmdb = TMDbClient(api_key)
-        results = tmdb.search_multi(query)
-        options = []
-        for item in results[:10]:
-            media_type = item.get("media_type", "movie")
-            title_text = item.get("title") or item.get("name", "Unknown")
-            year = (item.get("release_date") or item.get("first_air_date") or "")[:4]
-            type_icon = "🎬" if media_type == "movie" else "📺"
-            label = f"{type_icon} {title_text} ({year})" if year else f"{type_icon} {title_text}"
-            options.append((label, {"tmdb_id": item["id"], "media_type": media_type}))
-        return options
-    except Exception:
+    # TMDb search ignores case and surrounding spaces, so normalise for the cache key
+    query = (query or "").strip().lower()
+    if len(query) < MIN_QUERY_LENGTH or not api_key:
         return []
-
-
-# Search with autocomplete dropdown
-selected = st_searchbox(
-    search_tmdb,
-    key="movie_search",
-    placeholder="Search for a movie or TV show...",
-    default_options=[("🎬 The Dark Knight (2008)", {"tmdb_id": 155, "media_type": "movie"})],
-)
-
-# Display selected item details
-if selected:
+    options = _prefix_cache_lookup(query)
+    if options is None:
+        try:
+            options = cached_search(get_tmdb_client(api_key), hash_key(api_key), query)
+        except Exception:
+            return []
+        _prefix_cache_store(query, options)
+    _prefetch_details(api_key, options)
+    return options
+
+
+def render_crew_cast(data: dict):
+    """Crew and Cast expanders."""
+    # Crew section
+    with st.expander("Crew"):
+        crew_items = []
+        if data["directors"]:
+            crew_items.append(f"**Director:** {', '.join(data['directors'])}")
+        if data["writers"]:
+            crew_items.append(f"**Writers:** {', '.join(data['writers'][:5])}")
+        if data["producers"]:
+            crew_items.append(f"**Producers:** {', '.join(data['producers'])}")
+        if data["composers"]:
+            crew_items.append(f"**Composer:** {', '.join(data['composers'])}")
+        if data["cinematographers"]:
+            crew_items.append(f"**Cinematography:** {', '.join(data['cinematographers'])}")
+
+        if crew_items:
+            for item in crew_items:
+                st.markdown(item)
+        else:
+            st.write("No crew information available.")
+
+    # Cast section
+    with st.expander("Cast"):
+        if data["cast"]:
+            # One HTML block with lazily loaded photos instead of two columns and an image per actor
+            cast_html = '<div class="cast-list">'
+            for actor in data["cast"]:
+                photo = (
+                    f'<img src="{html.escape(actor["profile_url"])}" loading="lazy" decoding="async" width="60">'
+                    if actor["profile_url"] else '<span class="cast-photo"></span>'
+                )
+                cast_html += (
+                    f'<div class="cast-row">{photo}<span><b>{html.escape(actor["name"] or "")}</b>'
+                    f' as {html.escape(actor["character"] or "")}</span></div>'
+                )
+            cast_html += "</div>"
+            st.markdown(CAST_STYLES + cast_html, unsafe_allow_html=True)
+        else:
+            st.write("No cast information available.")
+
+
+def render_computed_attrs(data: dict):
+    """Computed Attributes cards used by the Cost Estimator."""
+    with st.expander("Computed Attributes", expanded=True):
+        st.caption("Auto-detected attributes used for finding comparable titles in the Cost Estimator")
+
+        get = data.get
+        attr_html = _render_computed_attrs_html(
+            get("computed_period", "N/A"),
+            get("computed_vfx", "N/A"),
+            get("computed_action", "N/A"),
+            get("computed_scale", "N/A"),
+            get("computed_star_power", "N/A"),
+            tuple(get("genres", [])),
+            get("budget_raw", 0),
+            tuple(c["name"] for c in get("cast", [])[:3]),
+        )
+        st.markdown(ATTR_STYLES + attr_html, unsafe_allow_html=True)
+
+
+def render_selected():
+    """Details view for the selected title."""
+    selected = st.session_state["selected_title"]
     tmdb_id = selected["tmdb_id"]
     media_type = selected["media_type"]
 
     with st.spinner("Loading details..."):
         api_key = get_secret("TMDB_API_KEY")
-        tmdb = TMDbClient(api_key)
-        data, errors = get_merged_details(tmdb, tmdb_id, media_type)
+        try:
+            data, errors = cached_merged_details(get_tmdb_client(api_key), hash_key(api_key), tmdb_id, media_type)
+        except DetailsUnavailable as e:
+            data, errors = None, e.errors
 
     if errors:
         for error in errors:
@@ -116,12 +308,12 @@ if selected:
             if data["vote_average"]:
                 st.markdown(f"**Rating:** ⭐ {data['vote_average']:.1f}/10 ({data['vote_count']:,} votes)")
 
-            if data["media_type"] == "movie" and data["directors"]:
+            if media_type == "movie" and data["directors"]:
                 st.markdown(f"**Director:** {', '.join(data['directors'])}")
             elif data.get("created_by"):
                 st.markdown(f"**Created by:** {', '.join(data['created_by'])}")
 
-            if data["media_type"] == "tv":
+            if media_type == "tv":
                 tv_info = []
                 if data["number_of_seasons"]:
                     tv_info.append(f"{data['number_of_seasons']} seasons")
@@ -137,7 +329,7 @@ if selected:
         st.write(data["overview"] or "No overview available.")
 
         # Financials (movies only)
-        if data["media_type"] == "movie":
+        if media_type == "movie":
             st.subheader("Financials")
 
             if data["budget"] or data["revenue"]:
@@ -150,9 +342,10 @@ if selected:
                     st.metric("Revenue", data["revenue"] or "N/A")
 
                 with fin_cols[2]:
-                    if data["budget_raw"] and data["revenue_raw"] and data["budget_raw"] > 0:
-                        profit = data["revenue_raw"] - data["budget_raw"]
-                        roi = (profit / data["budget_raw"]) * 100
+                    budget_raw, revenue_raw = data["budget_raw"], data["revenue_raw"]
+                    if budget_raw and revenue_raw and budget_raw > 0:
+                        profit = revenue_raw - budget_raw
+                        roi = (profit / budget_raw) * 100
                         profit_str = f"${profit / 1_000_000:.0f}M" if abs(profit) >= 1_000_000 else f"${profit:,}"
                         st.metric("Profit", profit_str, delta=f"{roi:.0f}% ROI")
                     else:
@@ -170,38 +363,7 @@ if selected:
             else:
                 st.info("💡 Budget/revenue data not found in Wikipedia or TMDb.")
 
-        # Crew section
-        with st.expander("Crew"):
-            crew_items = []
-            if data["directors"]:
-                crew_items.append(f"**Director:** {', '.join(data['directors'])}")
-            if data["writers"]:
-                crew_items.append(f"**Writers:** {', '.join(data['writers'][:5])}")
-            if data["producers"]:
-                crew_items.append(f"**Producers:** {', '.join(data['producers'])}")
-            if data["composers"]:
-                crew_items.append(f"**Composer:** {', '.join(data['composers'])}")
-            if data["cinematographers"]:
-                crew_items.append(f"**Cinematography:** {', '.join(data['cinematographers'])}")
-
-            if crew_items:
-                for item in crew_items:
-                    st.markdown(item)
-            else:
-                st.write("No crew information available.")
-
-        # Cast section
-        with st.expander("Cast"):
-            if data["cast"]:
-                for actor in data["cast"]:
-                    cast_col1, cast_col2 = st.columns([1, 4])
-                    with cast_col1:
-                        if actor["profile_url"]:
-                            st.image(actor["profile_url"], width=60)
-                    with cast_col2:
-                        st.markdown(f"**{actor['name']}** as {actor['character']}")
-            else:
-                st.write("No cast information available.")
+        render_crew_cast(data)
 
         # Additional info
         with st.expander("Additional Info"):
@@ -212,106 +374,24 @@ if selected:
             if data["original_language"]:
                 st.markdown(f"**Language:** {data['original_language'].upper()}")
 
-        # Computed Attributes (for Cost Estimator)
-        with st.expander("Computed Attributes", expanded=True):
-            st.caption("Auto-detected attributes used for finding comparable titles in the Cost Estimator")
-
-            # Get raw data for explanations
-            budget_raw = data.get("budget_raw", 0)
-            genres = data.get("genres", [])
-            cast_names = [c["name"] for c in data.get("cast", [])][:3]
-
-            # Create styled attribute cards
-            attr_html = """
-            <style>
-            .attr-grid { display: grid; grid-template-columns: repeat(5, 1fr); gap: 10px; margin: 10px 0; }
-            .attr-card { background: #f0f2f6; border-radius: 8px; padding: 12px; text-align: center; }
-            .attr-label { font-size: 11px; color: #666; text-transform: uppercase; margin-bottom: 4px; }
-            .attr-value { font-size: 14px; font-weight: 600; color: #1e3a5f; }
-            .attr-reason { font-size: 10px; color: #888; margin-top: 4px; }
-            </style>
-            <div class="attr-grid">
-            """
-
-            # Period
-            period = data.get("computed_period", "N/A")
-            period_reason = "from plot keywords" if period != "Contemporary" else "default (modern setting)"
-            attr_html += f'<div class="attr-card"><div class="attr-label">Period</div><div class="attr-value">{period}</div><div class="attr-reason">{period_reason}</div></div>'
-
-            # VFX
-            vfx = data.get("computed_vfx", "N/A")
-            vfx_genres = [g for g in genres if g.lower() in ["science fiction", "fantasy", "animation", "action", "adventure"]]
-            vfx_reason = f"genres: {', '.join(vfx_genres[:2])}" if vfx_genres else "based on genre mix"
-            attr_html += f'<div class="attr-card"><div class="attr-label">VFX Level</div><div class="attr-value">{vfx}</div><div class="attr-reason">{vfx_reason}</div></div>'
-
-            # Action
-            action = data.get("computed_action", "N/A")
-            action_genres = [g for g in genres if g.lower() in ["action", "adventure", "war", "drama", "comedy"]]
-            action_reason = f"genre: {action_genres[0]}" if action_genres else "from crew data"
-            attr_html += f'<div class="attr-card"><div class="attr-label">Action</div><div class="attr-value">{action}</div><div class="attr-reason">{action_reason}</div></div>'
-
-            # Scale
-            scale = data.get("computed_scale", "N/A")
-            if budget_raw and budget_raw > 0:
-                if budget_raw >= 1_000_000:
-                    scale_reason = f"budget: ${budget_raw/1_000_000:.0f}M"
-                else:
-                    scale_reason = f"budget: ${budget_raw/1_000:.0f}K"
-            else:
-                scale_reason = "no budget data"
-            scale_short = scale.split(" (")[0] if "(" in scale else scale
-            attr_html += f'<div class="attr-card"><div class="attr-label">Scale</div><div class="attr-value">{scale_short}</div><div class="attr-reason">{scale_reason}</div></div>'
-
-            # Star Power
-            star = data.get("computed_star_power", "N/A")
-            if cast_names:
-                star_reason = f"cast: {cast_names[0]}"
-            else:
-                star_reason = "no cast data"
-            attr_html += f'<div class="attr-card"><div class="attr-label">Star Power</div><div class="attr-value">{star}</div><div class="attr-reason">{star_reason}</div></div>'
+        render_computed_attrs(data)
+
+
+# Search with autocomplete dropdown
+selected = st_searchbox(
+    search_tmdb,
+    key="movie_search",
+    placeholder="Search for a movie or TV show...",
+    debounce=SEARCH_DEBOUNCE_MS,
+    default_options=[("🎬 The Dark Knight (2008)", {"tmdb_id": 155, "media_type": "movie"})],
+)
 
-            attr_html += "</div>"
-            st.markdown(attr_html, unsafe_allow_html=True)
+# Display selected item details
+if selected:
+    st.session_state["selected_title"] = selected
+    render_selected()
+else:
+    st.session_state.pop("selected_title", None)
 
 # Floating Feedback Bar
-FEEDBACK_BAR = """
-<style>
-.feedback-bar {
-    position: fixed;
-    bottom: 0;
-    left: 0;
-    width: 100%;
-    background: linear-gradient(90deg, #1e3a5f 0%, #2d5a87 100%);
-    padding: 12px 20px;
-    display: flex;
-    justify-content: center;
-    align-items: center;
-    gap: 15px;
-    z-index: 9999;
-    box-shadow: 0 -2px 10px rgba(0,0,0,0.2);
-}
-.feedback-bar p {
-    color: white;
-    margin: 0;
-    font-size: 14px;
-}
-.feedback-bar a {
-    background: #ff6b6b;
-    color: white;
-    padding: 8px 20px;
-    border-radius: 20px;
-    text-decoration: none;
-    font-weight: bold;
-    font-size: 14px;
-    transition: background 0.3s;
-}
-.feedback-bar a:hover {
-    background: #ff5252;
-}
-</style>
-<div class="feedback-bar">
-    <p>💡 Help us improve this tool!</p>
-    <a href="https://docs.google.com/forms/d/e/1FAIpQLSeD9j4-d0kVdt_UhT0etGqislY-Ue79PllVf9-akGLRu0r--A/viewform" target="_blank">Give Feedback</a>
-</div>
-"""
-st.markdown(FEEDBACK_BAR, unsafe_allow_html=True)
+render_feedback_bar()
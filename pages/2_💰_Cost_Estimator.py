@@ -1,56 +1,33 @@
+import html
 import os
 import sys
-import json
+from datetime import datetime
+import orjson
 import streamlit as st
-import streamlit.components.v1 as components
-from dotenv import load_dotenv
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from similarity import find_comparable_titles
-from estimator import adjust_for_inflation, format_currency
-
-load_dotenv()
+from similarity import TitleTable, find_comparable_titles
+from estimator import adjust_for_inflation_bulk, format_currency
+from shared import inject_analytics, render_feedback_bar
 
 st.set_page_config(page_title="Cost Estimator", page_icon="💰", layout="wide")
 
-# Google Analytics
-GA_TRACKING_CODE = """
-<!-- Google tag (gtag.js) -->
-<script async src="https://www.googletagmanager.com/gtag/js?id=G-7J88HTR1H2"></script>
-<script>
-  window.dataLayer = window.dataLayer || [];
-  function gtag(){dataLayer.push(arguments);}
-  gtag('js', new Date());
-  gtag('config', 'G-7J88HTR1H2');
-</script>
-"""
-components.html(GA_TRACKING_CODE, height=0)
+inject_analytics("cost_estimator")
+
 
+# Recency weight by years since release: 0-1 years old 2.0x, then 2, 3, 4, 5 and 6+ years
+RECENCY_MULTIPLIERS = (2.0, 2.0, 1.7, 1.4, 1.1, 0.9, 0.7)
 
-def get_recency_multiplier(year: int) -> float:
+
+def get_recency_multiplier(year: int, current_year: int) -> float:
     """Get recency weight based on release year.
 
     Recent films are more relevant to current production costs.
     Note: Comp titles are already filtered to last 6 years.
     """
-    from datetime import datetime
-    current_year = datetime.now().year
-
     years_old = current_year - year
-
-    if years_old <= 1:
-        return 2.0   # This year or last year - most relevant
-    elif years_old <= 2:
-        return 1.7   # 2 years old
-    elif years_old <= 3:
-        return 1.4   # 3 years old
-    elif years_old <= 4:
-        return 1.1   # 4 years old
-    elif years_old <= 5:
-        return 0.9   # 5 years old
-    else:
-        return 0.7   # 6 years old (edge of window)
+    return RECENCY_MULTIPLIERS[min(max(years_old, 0), len(RECENCY_MULTIPLIERS) - 1)]
 
 st.title("💰 Production Cost Estimator")
 
@@ -65,25 +42,88 @@ with st.sidebar:
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
 
 
-@st.cache_data
-def load_actor_tiers():
-    with open(os.path.join(DATA_DIR, "actor_tiers.json"), "r") as f:
-        return json.load(f)
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _load_title_table(path: str, mtime_ns: int, size: int) -> TitleTable:
+    """Parse the titles database into a scoring table; mtime and size are part of the cache key so edits are picked up."""
+    with open(path, "rb") as f:
+        return TitleTable(orjson.loads(f.read()).get("titles", []))
 
 
-@st.cache_data
-def load_studio_tiers():
-    with open(os.path.join(DATA_DIR, "studio_tiers.json"), "r") as f:
-        return json.load(f)
+def load_title_table() -> TitleTable:
+    """Load the titles database, rebuilding the scoring table only when the file has changed."""
+    db_path = os.path.join(DATA_DIR, "titles_db.json")
+    try:
+        stat = os.stat(db_path)
+        return _load_title_table(db_path, stat.st_mtime_ns, stat.st_size)
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return TitleTable([])
 
 
-def load_titles_db():
-    """Load titles database (no caching - always read fresh data)."""
-    try:
-        with open(os.path.join(DATA_DIR, "titles_db.json"), "r") as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {"titles": []}
+COMP_STYLES = """
+<style>
+.comp-row { display: flex; align-items: center; gap: 16px; padding: 12px 0; border-bottom: 1px solid rgba(128,128,128,0.2); }
+.comp-row img, .comp-poster { width: 80px; flex-shrink: 0; border-radius: 4px; }
+.comp-info { flex: 1; }
+.comp-title { font-weight: 600; margin-bottom: 4px; }
+.comp-caption, .comp-budget { font-size: 14px; color: #808495; }
+.comp-score { min-width: 180px; }
+.comp-score-label { font-size: 14px; }
+.comp-score-value { font-size: 2.25rem; line-height: 1.2; }
+</style>
+"""
+
+COMP_ROW = (
+    '<div class="comp-row">{poster}'
+    '<div class="comp-info"><div class="comp-title">{name} ({year})</div>{details}</div>'
+    '<div class="comp-score"><div class="comp-score-label">Match</div><div class="comp-score-value">{score}</div>'
+    '<div class="comp-budget">{budget}</div></div></div>'
+)
+
+
+BUDGET_RANGE = """
+<div style="background: #1e1e2f; border-radius: 12px; padding: 24px; margin: 10px 0 20px 0; border: 1px solid rgba(212,175,55,0.2);">
+    <div style="display: flex; justify-content: space-between; align-items: flex-end; margin-bottom: 16px;">
+        <div style="text-align: center;">
+            <div style="font-size: 12px; color: #a0aec0; text-transform: uppercase; letter-spacing: 1px;">Low</div>
+            <div style="font-size: 24px; font-weight: 700; color: #63b3ed;">{low}</div>
+        </div>
+        <div style="text-align: center;">
+            <div style="font-size: 12px; color: #d4af37; text-transform: uppercase; letter-spacing: 1px;">Base Estimate</div>
+            <div style="font-size: 36px; font-weight: 700; color: #d4af37;">{base}</div>
+        </div>
+        <div style="text-align: center;">
+            <div style="font-size: 12px; color: #a0aec0; text-transform: uppercase; letter-spacing: 1px;">High</div>
+            <div style="font-size: 24px; font-weight: 700; color: #fc8181;">{high}</div>
+        </div>
+    </div>
+    <div style="position: relative; height: 12px; background: linear-gradient(90deg, #63b3ed 0%, #d4af37 50%, #fc8181 100%); border-radius: 6px; margin: 0 10px;">
+        <div style="position: absolute; top: -4px; left: 50%; transform: translateX(-50%); width: 20px; height: 20px; background: #d4af37; border-radius: 50%; border: 3px solid #1e1e2f;"></div>
+    </div>
+    <div style="text-align: center; margin-top: 12px;">
+        <span style="font-size: 12px; color: #718096;">Based on {count} comparable titles</span>
+    </div>
+</div>
+"""
+
+CONTRIBUTION_BAR = """
+<div style="margin-bottom: 12px;">
+    <div style="display: flex; justify-content: space-between; margin-bottom: 4px;">
+        <span style="font-weight: 600; font-size: 14px;">{title} <span style="color: #718096; font-weight: 400;">({year})</span></span>
+        <span style="font-weight: 600; font-size: 14px;">{contribution} <span style="color: #718096; font-weight: 400;">({pct:.0f}%)</span></span>
+    </div>
+    <div style="background: #2d3748; border-radius: 4px; height: 24px; overflow: hidden;">
+        <div style="background: linear-gradient(90deg, #d4af37, #b8960c); width: {width}%; height: 100%; border-radius: 4px; display: flex; align-items: center; padding-left: 8px;">
+            <span style="font-size: 11px; color: #1a1a2e; font-weight: 600;">{similarity:.0f}% sim · {recency}x rec · {budget}</span>
+        </div>
+    </div>
+</div>
+"""
+
+CONTRIBUTION_TOTAL = """
+<div style="text-align: right; padding-top: 8px; border-top: 1px solid #2d3748; margin-top: 8px;">
+    <span style="font-weight: 700; font-size: 16px;">Weighted Total: {total}</span>
+</div>
+"""
 
 
 # Attribute Definitions
@@ -122,162 +162,131 @@ with col2:
 
 st.divider()
 
-# Estimate Button
-if st.button("🔍 Find Comparable Titles & Estimate", type="primary"):
-    db = load_titles_db()
-    titles = db.get("titles", [])
-
-    if len(titles) < 3:
-        st.warning(f"⚠️ Only {len(titles)} titles in database. Add more titles via Title Search for better estimates!")
-
-    if titles:
-        # Build user attributes dict for similarity matching
-        user_attrs = {
-            "genre": genre,
-            "scale": scale,
-            "vfx": vfx,
-            "action": action,
-            "period": period,
-            "star_power": star_power,
-            "country": country,
-            "runtime": runtime,
-        }
-
-        # Find comparable titles
-        comparables = find_comparable_titles(user_attrs, titles, limit=5)
-
-        st.subheader("Comparable Titles")
-
-        if comparables:
-            for comp in comparables:
-                title = comp["title"]
-                score = comp["score"]
-                reasons = comp["reasons"]
-
-                with st.container():
-                    tcol1, tcol2, tcol3 = st.columns([1, 3, 1])
-                    with tcol1:
-                        if title.get("poster_url"):
-                            st.image(title["poster_url"], width=80)
-                    with tcol2:
-                        year_str = title.get("release_date", "")[:4] if title.get("release_date") else "N/A"
-                        tmdb_link = title.get("tmdb_url", "")
-                        if tmdb_link:
-                            st.markdown(f"**[{title.get('title', 'Unknown')}]({tmdb_link})** ({year_str})")
-                        else:
-                            st.markdown(f"**{title.get('title', 'Unknown')}** ({year_str})")
-                        if reasons:
-                            tags = " ".join(f"`{r}`" for r in reasons)
-                            st.markdown(f"**Why similar:** {tags}", help="Attributes matching your project")
-                        else:
-                            st.caption(f"{', '.join(title.get('genres', [])[:3])}")
-                    with tcol3:
-                        st.metric("Match", f"{score:.0f}%")
-                        if title.get("budget_raw"):
-                            original = title["budget_raw"]
-                            if adjust_inflation and year_str.isdigit():
-                                adjusted = adjust_for_inflation(original, int(year_str))
-                                st.caption(f"Budget: {format_currency(original)} → {format_currency(adjusted)} (2024$)")
-                            else:
-                                st.caption(f"Budget: {format_currency(original)}")
-                    st.divider()
-
-            # Calculate budget estimate from comparable titles (weighted by similarity + recency)
-            # Always use 2024-adjusted dollars for the final estimate
-            weighted_data = []
-            for c in comparables:
-                if c["title"].get("budget_raw"):
-                    original = c["title"]["budget_raw"]
-                    year_str = c["title"].get("release_date", "")[:4]
-                    if year_str.isdigit():
-                        year = int(year_str)
-                        budget = adjust_for_inflation(original, year)
-                        similarity = c["score"]
-                        recency = get_recency_multiplier(year)
-                        combined_weight = similarity * recency
-                        weighted_data.append({
-                            "title": c["title"].get("title", "Unknown"),
-                            "year": year,
-                            "budget": budget,
-                            "original_budget": original,
-                            "similarity": similarity,
-                            "recency": recency,
-                            "weight": combined_weight,
-                        })
-
-            if weighted_data:
-                # Calculate weighted average
-                total_weight = sum(d["weight"] for d in weighted_data)
-                for d in weighted_data:
-                    d["contribution"] = (d["weight"] / total_weight) * d["budget"]
-
-                avg_budget = sum(d["contribution"] for d in weighted_data)
-                low_budget = min(d["budget"] for d in weighted_data)
-                high_budget = max(d["budget"] for d in weighted_data)
-
-                st.subheader("Estimated Budget Range")
-                st.caption("All budgets adjusted to 2024 dollars | Weighted by similarity + recency")
-
-                # --- Visual Budget Range Bar ---
-                range_html = f"""
-                <div style="background: #1e1e2f; border-radius: 12px; padding: 24px; margin: 10px 0 20px 0; border: 1px solid rgba(212,175,55,0.2);">
-                    <div style="display: flex; justify-content: space-between; align-items: flex-end; margin-bottom: 16px;">
-                        <div style="text-align: center;">
-                            <div style="font-size: 12px; color: #a0aec0; text-transform: uppercase; letter-spacing: 1px;">Low</div>
-                            <div style="font-size: 24px; font-weight: 700; color: #63b3ed;">{format_currency(int(low_budget))}</div>
-                        </div>
-                        <div style="text-align: center;">
-                            <div style="font-size: 12px; color: #d4af37; text-transform: uppercase; letter-spacing: 1px;">Base Estimate</div>
-                            <div style="font-size: 36px; font-weight: 700; color: #d4af37;">{format_currency(int(avg_budget))}</div>
-                        </div>
-                        <div style="text-align: center;">
-                            <div style="font-size: 12px; color: #a0aec0; text-transform: uppercase; letter-spacing: 1px;">High</div>
-                            <div style="font-size: 24px; font-weight: 700; color: #fc8181;">{format_currency(int(high_budget))}</div>
-                        </div>
-                    </div>
-                    <div style="position: relative; height: 12px; background: linear-gradient(90deg, #63b3ed 0%, #d4af37 50%, #fc8181 100%); border-radius: 6px; margin: 0 10px;">
-                        <div style="position: absolute; top: -4px; left: 50%; transform: translateX(-50%); width: 20px; height: 20px; background: #d4af37; border-radius: 50%; border: 3px solid #1e1e2f;"></div>
-                    </div>
-                    <div style="text-align: center; margin-top: 12px;">
-                        <span style="font-size: 12px; color: #718096;">Based on {len(weighted_data)} comparable titles</span>
-                    </div>
-                </div>
-                """
-                st.markdown(range_html, unsafe_allow_html=True)
-
-                # --- Budget Contribution Chart ---
-                sorted_data = sorted(weighted_data, key=lambda x: x["contribution"], reverse=True)
-                max_contribution = max(d["contribution"] for d in sorted_data)
-
-                with st.expander("📊 Contribution Breakdown", expanded=True):
-                    for d in sorted_data:
-                        pct = (d["contribution"] / avg_budget) * 100
-                        bar_width = (d["contribution"] / max_contribution) * 100
-
-                        bar_html = f"""
-                        <div style="margin-bottom: 12px;">
-                            <div style="display: flex; justify-content: space-between; margin-bottom: 4px;">
-                                <span style="font-weight: 600; font-size: 14px;">{d['title']} <span style="color: #718096; font-weight: 400;">({d['year']})</span></span>
-                                <span style="font-weight: 600; font-size: 14px;">{format_currency(int(d['contribution']))} <span style="color: #718096; font-weight: 400;">({pct:.0f}%)</span></span>
-                            </div>
-                            <div style="background: #2d3748; border-radius: 4px; height: 24px; overflow: hidden;">
-                                <div style="background: linear-gradient(90deg, #d4af37, #b8960c); width: {bar_width}%; height: 100%; border-radius: 4px; display: flex; align-items: center; padding-left: 8px;">
-                                    <span style="font-size: 11px; color: #1a1a2e; font-weight: 600;">{d['similarity']:.0f}% sim · {d['recency']}x rec · {format_currency(d['budget'])}</span>
-                                </div>
-                            </div>
-                        </div>
-                        """
-                        st.markdown(bar_html, unsafe_allow_html=True)
-
-                    st.markdown(f"""
-                    <div style="text-align: right; padding-top: 8px; border-top: 1px solid #2d3748; margin-top: 8px;">
-                        <span style="font-weight: 700; font-size: 16px;">Weighted Total: {format_currency(int(avg_budget))}</span>
-                    </div>
-                    """, unsafe_allow_html=True)
-
-                # --- Methodology ---
-                with st.expander("📋 Methodology"):
-                    st.markdown("""
+
+@st.fragment
+def render_results(comparables: list, adjust_inflation: bool):
+    """Comparable titles and the budget estimate, rendered from stored results without rescoring."""
+    st.subheader("Comparable Titles")
+
+    if comparables:
+        # Parse each release year once and adjust every dated budget to 2024 dollars
+        # in one pass; both the list below and the estimate use these values
+        budgeted = []
+        for c in comparables:
+            release_date = c["title"].get("release_date")
+            c["year_str"] = release_date[:4] if release_date else "N/A"
+            if c["title"].get("budget_raw") and c["year_str"].isdigit():
+                budgeted.append((c, int(c["year_str"])))
+        adjusted = adjust_for_inflation_bulk(
+            [c["title"]["budget_raw"] for c, _ in budgeted],
+            [year for _, year in budgeted],
+        ).tolist()
+        for (c, _), budget in zip(budgeted, adjusted):
+            c["adjusted_budget"] = budget
+
+        # All comparables in one HTML block instead of columns, an image and a divider per row
+        rows = []
+        for comp in comparables:
+            title = comp["title"]
+            reasons = comp["reasons"]
+
+            name = html.escape(title.get("title", "Unknown"))
+            tmdb_link = title.get("tmdb_url", "")
+            if tmdb_link:
+                name = f'<a href="{html.escape(tmdb_link)}" target="_blank">{name}</a>'
+            if reasons:
+                tags = " ".join(f"<code>{html.escape(r)}</code>" for r in reasons)
+                details = f'<div class="comp-why" title="Attributes matching your project"><b>Why similar:</b> {tags}</div>'
+            else:
+                details = f'<div class="comp-caption">{html.escape(", ".join(title.get("genres", [])[:3]))}</div>'
+
+            budget = ""
+            if title.get("budget_raw"):
+                original = title["budget_raw"]
+                if adjust_inflation and "adjusted_budget" in comp:
+                    budget = f"Budget: {format_currency(original)} → {format_currency(comp['adjusted_budget'])} (2024$)"
+                else:
+                    budget = f"Budget: {format_currency(original)}"
+
+            poster = (
+                f'<img src="{html.escape(title["poster_url"])}" loading="lazy" decoding="async" width="80">'
+                if title.get("poster_url") else '<span class="comp-poster"></span>'
+            )
+            rows.append(COMP_ROW.format(
+                poster=poster,
+                name=name,
+                year=comp["year_str"],
+                details=details,
+                score=f"{comp['score']:.0f}%",
+                budget=budget,
+            ))
+        st.markdown(COMP_STYLES + '<div class="comp-list">' + "".join(rows) + "</div>", unsafe_allow_html=True)
+
+        # Calculate budget estimate from comparable titles (weighted by similarity + recency)
+        # Always use 2024-adjusted dollars for the final estimate
+        current_year = datetime.now().year
+        weighted_data = []
+        for c, year in budgeted:
+            budget = c["adjusted_budget"]
+            similarity = c["score"]
+            recency = get_recency_multiplier(year, current_year)
+            combined_weight = similarity * recency
+            weighted_data.append({
+                "title": c["title"].get("title", "Unknown"),
+                "year": year,
+                "budget": budget,
+                "original_budget": c["title"]["budget_raw"],
+                "similarity": similarity,
+                "recency": recency,
+                "weight": combined_weight,
+            })
+
+        if weighted_data:
+            # Calculate weighted average
+            total_weight = sum(d["weight"] for d in weighted_data)
+            for d in weighted_data:
+                d["contribution"] = (d["weight"] / total_weight) * d["budget"]
+
+            avg_budget = sum(d["contribution"] for d in weighted_data)
+            low_budget = min(d["budget"] for d in weighted_data)
+            high_budget = max(d["budget"] for d in weighted_data)
+
+            st.subheader("Estimated Budget Range")
+            st.caption("All budgets adjusted to 2024 dollars | Weighted by similarity + recency")
+
+            # --- Visual Budget Range Bar ---
+            range_html = BUDGET_RANGE.format(
+                low=format_currency(int(low_budget)),
+                base=format_currency(int(avg_budget)),
+                high=format_currency(int(high_budget)),
+                count=len(weighted_data),
+            )
+            st.markdown(range_html, unsafe_allow_html=True)
+
+            # --- Budget Contribution Chart ---
+            sorted_data = sorted(weighted_data, key=lambda x: x["contribution"], reverse=True)
+            max_contribution = max(d["contribution"] for d in sorted_data)
+
+            with st.expander("📊 Contribution Breakdown", expanded=True):
+                # Every bar and the total in one markdown call
+                bars = []
+                for d in sorted_data:
+                    bars.append(CONTRIBUTION_BAR.format(
+                        title=html.escape(d["title"]),
+                        year=d["year"],
+                        contribution=format_currency(int(d["contribution"])),
+                        pct=(d["contribution"] / avg_budget) * 100,
+                        width=(d["contribution"] / max_contribution) * 100,
+                        similarity=d["similarity"],
+                        recency=d["recency"],
+                        budget=format_currency(d["budget"]),
+                    ))
+                bars.append(CONTRIBUTION_TOTAL.format(total=format_currency(int(avg_budget))))
+                st.markdown("".join(bars), unsafe_allow_html=True)
+
+            # --- Methodology ---
+            with st.expander("📋 Methodology"):
+                st.markdown("""
 **How it works:** Weighted average of comparable titles from the **last 6 years**
 
 Each title's influence = `Similarity Score × Recency Multiplier`
@@ -292,12 +301,43 @@ Each title's influence = `Similarity Score × Recency Multiplier`
 | 6 years | **0.7x** | Edge of relevance window |
 
 **Why 6 years?** Industry standard — producers typically use recent comps for pitch decks.
-                    """)
-            else:
-                st.info("No budget data available for comparable titles.")
+                """)
         else:
-            st.info("No similar titles found. Try adjusting your attributes.")
+            st.info("No budget data available for comparable titles.")
+    else:
+        st.info("No similar titles found. Try adjusting your attributes.")
+
+
+# Build user attributes dict for similarity matching
+user_attrs = {
+    "genre": genre,
+    "scale": scale,
+    "vfx": vfx,
+    "action": action,
+    "period": period,
+    "star_power": star_power,
+    "country": country,
+    "runtime": runtime,
+}
 
+# Estimate Button
+if st.button("🔍 Find Comparable Titles & Estimate", type="primary"):
+    table = load_title_table()
+    st.session_state["estimate"] = {
+        "user_attrs": user_attrs,
+        "title_count": len(table),
+        "comparables": find_comparable_titles(user_attrs, table, limit=5) if len(table) else [],
+    }
+
+# Results stay up until the attributes change, so flipping the inflation toggle
+# only re-renders them instead of rerunning the search
+estimate = st.session_state.get("estimate")
+if estimate and estimate["user_attrs"] == user_attrs:
+    if estimate["title_count"] < 3:
+        st.warning(f"⚠️ Only {estimate['title_count']} titles in database. Add more titles via Title Search for better estimates!")
+
+    if estimate["title_count"]:
+        render_results(estimate["comparables"], adjust_inflation)
     else:
         st.error("No titles in database! Go to Title Search and save some titles first.")
 
@@ -306,44 +346,4 @@ with st.sidebar:
     st.caption("Data from [TMDb](https://www.themoviedb.org)")
 
 # Floating Feedback Bar
-FEEDBACK_BAR = """
-<style>
-.feedback-bar {
-    position: fixed;
-    bottom: 0;
-    left: 0;
-    width: 100%;
-    background: linear-gradient(90deg, #1e3a5f 0%, #2d5a87 100%);
-    padding: 12px 20px;
-    display: flex;
-    justify-content: center;
-    align-items: center;
-    gap: 15px;
-    z-index: 9999;
-    box-shadow: 0 -2px 10px rgba(0,0,0,0.2);
-}
-.feedback-bar p {
-    color: white;
-    margin: 0;
-    font-size: 14px;
-}
-.feedback-bar a {
-    background: #ff6b6b;
-    color: white;
-    padding: 8px 20px;
-    border-radius: 20px;
-    text-decoration: none;
-    font-weight: bold;
-    font-size: 14px;
-    transition: background 0.3s;
-}
-.feedback-bar a:hover {
-    background: #ff5252;
-}
-</style>
-<div class="feedback-bar">
-    <p>💡 Help us improve this tool!</p>
-    <a href="https://docs.google.com/forms/d/e/1FAIpQLSeD9j4-d0kVdt_UhT0etGqislY-Ue79PllVf9-akGLRu0r--A/viewform" target="_blank">Give Feedback</a>
-</div>
-"""
-st.markdown(FEEDBACK_BAR, unsafe_allow_html=True)
+render_feedback_bar()
@@ -0,0 +1,7 @@
+"""Filesystem locations shared by the database scripts."""
+import os
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(SCRIPTS_DIR)
+DATA_DIR = os.path.join(ROOT_DIR, "data")
+OUTPUT_FILE = os.path.join(DATA_DIR, "titles_db.json")
@@ -11,21 +11,22 @@ Usage:
 
 import os
 import sys
-import json
-import time
+
+from _paths import OUTPUT_FILE, SCRIPTS_DIR, ROOT_DIR
 
 # Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT_DIR)
 
+import orjson
 from dotenv import load_dotenv
-from api.tmdb import TMDbClient, get_poster_url, get_profile_url
+from api.tmdb import TMDbClient, get_poster_url
+from api.merged import extract_cast
 from api.attributes import compute_all_attributes
+from api.ratelimit import TMDB_LIMITER
 
 load_dotenv()
 
-DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
-TV_SHOWS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tv_shows.json")
-OUTPUT_FILE = os.path.join(DATA_DIR, "titles_db.json")
+TV_SHOWS_FILE = os.path.join(SCRIPTS_DIR, "tv_shows.json")
 
 
 def format_currency(amount: int) -> str:
@@ -39,12 +40,34 @@ def format_currency(amount: int) -> str:
     return f"${amount:,}"
 
 
+def extract_crew_roles(crew: list) -> tuple[list, list, list, list]:
+    """Collect directors, writers, producers and all job titles in one pass over crew."""
+    directors, writers, producers, jobs = [], [], [], []
+    append_job = jobs.append
+    for person in crew:
+        job = person.get("job")
+        if not job:
+            continue
+        append_job(job)
+        if job == "Director":
+            if len(directors) < 3:
+                directors.append(person["name"])
+        elif job in ("Writer", "Screenplay"):
+            if len(writers) < 5:
+                writers.append(person["name"])
+        elif "Producer" in job:
+            if len(producers) < 3:
+                producers.append(person["name"])
+    return directors, writers, producers, jobs
+
+
 def get_tv_details_with_budget(client: TMDbClient, tmdb_id: int, budget_per_episode: int, notes: str) -> dict:
     """Fetch TV show details and add curated budget data."""
     try:
-        # Get TMDb data
-        tmdb_data = client.get_tv_details(tmdb_id)
-        credits = client.get_tv_credits(tmdb_id)
+        # Details and credits come back together via append_to_response
+        TMDB_LIMITER.acquire()
+        tmdb_data = client.get_tv_bundle(tmdb_id)
+        credits = tmdb_data.pop("credits", None)
     except Exception as e:
         print(f"  Error fetching TMDb data: {e}")
         return None
@@ -53,38 +76,46 @@ def get_tv_details_with_budget(client: TMDbClient, tmdb_id: int, budget_per_epis
         return None
 
     # Extract cast
-    cast_list = credits.get("cast", [])[:10] if credits else []
-    cast = [
-        {
-            "name": person.get("name"),
-            "character": person.get("character"),
-            "profile_url": get_profile_url(person.get("profile_path")),
-        }
-        for person in cast_list
-    ]
+    cast = extract_cast(credits) if credits else []
 
     # Extract crew
     crew = credits.get("crew", []) if credits else []
-    directors = [p["name"] for p in crew if p.get("job") == "Director"][:3]
-    writers = [p["name"] for p in crew if p.get("job") in ("Writer", "Screenplay")][:5]
-    producers = [p["name"] for p in crew if "Producer" in (p.get("job") or "")][:3]
+    directors, writers, producers, crew_jobs = extract_crew_roles(crew)
 
     # Calculate total budget estimate (per episode * episodes in first season or average)
     num_episodes = tmdb_data.get("number_of_episodes", 10)
     total_budget_estimate = budget_per_episode * min(num_episodes, 20)  # Cap at 20 episodes
 
-    result = {
-        "title": tmdb_data.get("name"),
+    title = tmdb_data.get("name")
+    overview = tmdb_data.get("overview")
+    genres = [g["name"] for g in tmdb_data.get("genres", [])]
+    production_companies = [c["name"] for c in tmdb_data.get("production_companies", [])]
+
+    # Compute attributes from just the fields the detectors read
+    computed = compute_all_attributes(
+        {
+            "title": title,
+            "overview": overview,
+            "genres": genres,
+            "budget_raw": budget_per_episode,
+            "production_companies": production_companies,
+            "cast": cast,
+        },
+        crew_jobs,
+    )
+
+    return {
+        "title": title,
         "original_title": tmdb_data.get("original_name"),
-        "overview": tmdb_data.get("overview"),
+        "overview": overview,
         "poster_url": get_poster_url(tmdb_data.get("poster_path")),
         "release_date": tmdb_data.get("first_air_date"),
-        "genres": [g["name"] for g in tmdb_data.get("genres", [])],
+        "genres": genres,
         "runtime": tmdb_data.get("episode_run_time", [60])[0] if tmdb_data.get("episode_run_time") else 60,
         "status": tmdb_data.get("status"),
         "original_language": tmdb_data.get("original_language"),
         "production_countries": [c["name"] for c in tmdb_data.get("production_countries", [])],
-        "production_companies": [c["name"] for c in tmdb_data.get("production_companies", [])],
+        "production_companies": production_companies,
         "media_type": "tv",
         "tmdb_id": tmdb_id,
 
@@ -117,20 +148,14 @@ def get_tv_details_with_budget(client: TMDbClient, tmdb_id: int, budget_per_epis
         # No revenue for TV
         "revenue": None,
         "revenue_raw": None,
-    }
 
-    # Compute attributes
-    crew_jobs = [p.get("job") for p in crew if p.get("job")]
-    computed = compute_all_attributes(result, crew_jobs)
-    result.update({
+        # Computed attributes
         "computed_period": computed["period"],
         "computed_vfx": computed["vfx"],
         "computed_action": computed["action"],
         "computed_scale": computed["scale"],
         "computed_star_power": computed["star_power"],
-    })
-
-    return result
+    }
 
 
 def main():
@@ -142,8 +167,8 @@ def main():
     client = TMDbClient(api_key)
 
     # Load TV shows list
-    with open(TV_SHOWS_FILE, "r") as f:
-        tv_data = json.load(f)
+    with open(TV_SHOWS_FILE, "rb") as f:
+        tv_data = orjson.loads(f.read())
 
     shows = tv_data.get("shows", [])
     print(f"Found {len(shows)} TV shows to add")
@@ -151,13 +176,13 @@ def main():
     # Load existing database
     existing_db = {"version": "1.0", "titles": []}
     if os.path.exists(OUTPUT_FILE):
-        with open(OUTPUT_FILE, "r") as f:
-            existing_db = json.load(f)
+        with open(OUTPUT_FILE, "rb") as f:
+            existing_db = orjson.loads(f.read())
 
-    existing_ids = {t.get("tmdb_id") for t in existing_db.get("titles", [])}
+    all_titles = existing_db.pop("titles", [])
+    existing_ids = {t.get("tmdb_id") for t in all_titles}
     print(f"Existing database has {len(existing_ids)} titles")
 
-    all_titles = list(existing_db.get("titles", []))
     added = 0
     skipped = 0
     errors = 0
@@ -176,8 +201,6 @@ def main():
             skipped += 1
             continue
 
-        time.sleep(0.25)  # Rate limiting
-
         details = get_tv_details_with_budget(client, tmdb_id, budget, notes)
         if details:
             all_titles.append(details)
@@ -195,8 +218,8 @@ def main():
         "titles": all_titles,
     }
 
-    with open(OUTPUT_FILE, "w") as f:
-        json.dump(output_db, f, indent=2)
+    with open(OUTPUT_FILE, "wb") as f:
+        f.write(orjson.dumps(output_db, option=orjson.OPT_INDENT_2))
 
     print("\n" + "=" * 60)
     print(f"DONE!")
@@ -4,6 +4,7 @@ Expand titles_db.json to ~10,000 movies with good genre coverage.
 
 Fetches movies from 2019-2024 (last 6 years) across all major genres.
 Ensures budget data is available (TMDb + Wikipedia fallback).
+New titles are checkpointed to titles_db.ndjson and recovered if a run is interrupted.
 
 Usage:
     python scripts/expand_db.py
@@ -14,17 +15,20 @@ Environment:
 
 import os
 import sys
-import json
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from collections import defaultdict
 
+from _paths import DATA_DIR, OUTPUT_FILE, ROOT_DIR
+
 # Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT_DIR)
 
+import orjson
 from dotenv import load_dotenv
 from api.tmdb import TMDbClient
 from api.merged import get_merged_details
+from api.ratelimit import TMDB_LIMITER
 
 load_dotenv()
 
@@ -32,7 +36,7 @@ load_dotenv()
 START_YEAR = 2019       # Last 6 years per industry standard
 END_YEAR = 2024
 TARGET_TOTAL = 5000     # Target ~5,000 titles
-RATE_LIMIT_DELAY = 0.15  # Seconds between API calls (TMDb allows ~40/sec)
+MAX_WORKERS = 8         # Concurrent detail fetches (Wikipedia lookups overlap too)
 MIN_VOTE_COUNT = 10     # Low threshold to include indie films
 
 # TMDb genre IDs for good coverage
@@ -58,8 +62,8 @@ GENRES = {
     37: "Western",
 }
 
-DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
-OUTPUT_FILE = os.path.join(DATA_DIR, "titles_db.json")
+# Append-only checkpoint of titles added since the last full save (one JSON record per line)
+JOURNAL_FILE = os.path.join(DATA_DIR, "titles_db.ndjson")
 
 
 def discover_movies(client: TMDbClient, year: int, genre_id: int = None, page: int = 1) -> list:
@@ -77,6 +81,27 @@ def discover_movies(client: TMDbClient, year: int, genre_id: int = None, page: i
     return data.get("results", []), data.get("total_pages", 0)
 
 
+def fetch_movie(client: TMDbClient, tmdb_id: int) -> tuple[dict, bool]:
+    """Fetch merged details for one movie. Returns (details, failed)."""
+    TMDB_LIMITER.acquire()
+    try:
+        details, errs = get_merged_details(client, tmdb_id, "movie", skip_wikipedia=False)
+    except Exception:
+        return None, True
+    return details, False
+
+
+def load_journal(path: str):
+    """Yield title records from an NDJSON journal left by an interrupted run."""
+    if not os.path.exists(path):
+        return
+    with open(path, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield orjson.loads(line)
+
+
 def main():
     api_key = os.getenv("TMDB_API_KEY")
     if not api_key:
@@ -88,11 +113,21 @@ def main():
     # Load existing database
     existing_db = {"version": "1.0", "titles": []}
     if os.path.exists(OUTPUT_FILE):
-        with open(OUTPUT_FILE, "r") as f:
-            existing_db = json.load(f)
-
-    existing_ids = {t.get("tmdb_id") for t in existing_db.get("titles", [])}
-    all_titles = list(existing_db.get("titles", []))
+        with open(OUTPUT_FILE, "rb") as f:
+            existing_db = orjson.loads(f.read())
+
+    all_titles = existing_db.pop("titles", [])
+    existing_ids = {t.get("tmdb_id") for t in all_titles}
+
+    # Recover titles checkpointed by a run that never reached its final save
+    recovered = 0
+    for details in load_journal(JOURNAL_FILE):
+        if details.get("tmdb_id") not in existing_ids:
+            all_titles.append(details)
+            existing_ids.add(details.get("tmdb_id"))
+            recovered += 1
+    if recovered:
+        print(f"Recovered {recovered} titles from {JOURNAL_FILE}")
 
     print(f"Existing database: {len(existing_ids)} titles")
     print(f"Target: {TARGET_TOTAL} titles")
@@ -114,6 +149,14 @@ def main():
     print(f"Need {titles_needed} more titles (~{titles_per_year}/year)")
     print("=" * 60)
 
+    # Ids already in the database or already fetched this run. Discover pages
+    # drift as popularity changes, so a title can reappear on a later page;
+    # no-budget titles in particular would otherwise be fetched again.
+    seen_ids = set(existing_ids)
+
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    journal = open(JOURNAL_FILE, "ab")
+
     for year in years:
         year_count = 0
         year_target = titles_per_year
@@ -125,26 +168,32 @@ def main():
                 break
 
             try:
+                TMDB_LIMITER.acquire()
                 movies, total_pages = discover_movies(client, year, page=page)
                 if not movies or page > total_pages:
                     break
 
+                tmdb_ids = []
                 for movie in movies:
-                    if year_count >= year_target:
-                        break
-
                     tmdb_id = movie.get("id")
-                    if tmdb_id in existing_ids:
+                    if tmdb_id in seen_ids:
                         skipped_duplicate += 1
                         continue
-
-                    time.sleep(RATE_LIMIT_DELAY)
-
-                    try:
-                        details, errs = get_merged_details(client, tmdb_id, "movie", skip_wikipedia=False)
-                        if details and details.get("budget_raw") and details["budget_raw"] > 0:
+                    seen_ids.add(tmdb_id)
+                    tmdb_ids.append(tmdb_id)
+
+                # Fetch at most the remaining quota at a time, so nothing past the cap is fetched
+                while tmdb_ids and year_count < year_target:
+                    batch = tmdb_ids[:year_target - year_count]
+                    del tmdb_ids[:len(batch)]
+                    results = executor.map(lambda tmdb_id: fetch_movie(client, tmdb_id), batch)
+                    for tmdb_id, (details, failed) in zip(batch, results):
+                        if failed:
+                            errors += 1
+                        elif details and details.get("budget_raw") and details["budget_raw"] > 0:
                             all_titles.append(details)
-                            existing_ids.add(tmdb_id)
+                            journal.write(orjson.dumps(details) + b"\n")
+                            journal.flush()
                             year_count += 1
                             new_count += 1
 
@@ -154,12 +203,11 @@ def main():
 
                             if new_count % 25 == 0:
                                 print(f"  Added {new_count} titles total ({len(all_titles)} in DB)")
-                                # Save periodically
-                                save_db(all_titles, OUTPUT_FILE)
                         else:
                             skipped_no_budget += 1
-                    except Exception as e:
-                        errors += 1
+
+                # Ids left once the year is full were never fetched
+                seen_ids.difference_update(tmdb_ids)
 
             except Exception as e:
                 print(f"  Error on page {page}: {e}")
@@ -172,8 +220,12 @@ def main():
             print(f"\nReached target of {TARGET_TOTAL} titles!")
             break
 
-    # Final save
+    executor.shutdown()
+    journal.close()
+
+    # Final save folds the journal into the database
     save_db(all_titles, OUTPUT_FILE)
+    os.remove(JOURNAL_FILE)
 
     print("\n" + "=" * 60)
     print("DONE!")
@@ -188,14 +240,17 @@ def main():
 
 
 def save_db(titles: list, path: str):
-    """Save database to file."""
+    """Save database to file, atomically replacing the previous version."""
     output_db = {
         "version": "1.0",
         "last_updated": datetime.now().isoformat(),
         "titles": titles,
     }
-    with open(path, "w") as f:
-        json.dump(output_db, f, indent=2)
+    # Write beside the target and rename, so a crash never leaves a torn database
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(orjson.dumps(output_db, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, path)
 
 
 if __name__ == "__main__":
@@ -14,16 +14,19 @@ Environment:
 
 import os
 import sys
-import json
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from _paths import OUTPUT_FILE, ROOT_DIR
+
 # Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT_DIR)
 
+import orjson
 from dotenv import load_dotenv
 from api.tmdb import TMDbClient
 from api.merged import get_merged_details
+from api.ratelimit import TMDB_LIMITER
 
 load_dotenv()
 
@@ -32,12 +35,9 @@ START_YEAR = 2015       # 10 years of data
 END_YEAR = 2024
 MOVIES_PER_YEAR = 100   # Target ~1000 total titles
 MAX_PAGES_PER_YEAR = 10  # TMDb returns 20 results per page
-RATE_LIMIT_DELAY = 0.25  # Seconds between API calls to avoid rate limiting
+MAX_WORKERS = 8         # Concurrent detail fetches
 MIN_VOTE_COUNT = 20     # Lowered from 100 to include more indie films
 
-DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
-OUTPUT_FILE = os.path.join(DATA_DIR, "titles_db.json")
-
 
 def discover_movies_by_year(client: TMDbClient, year: int, page: int = 1) -> list:
     """
@@ -55,6 +55,16 @@ def discover_movies_by_year(client: TMDbClient, year: int, page: int = 1) -> lis
     return data.get("results", [])
 
 
+def fetch_movie(client: TMDbClient, tmdb_id: int) -> tuple[dict, bool]:
+    """Fetch merged details for one movie. Returns (details, failed)."""
+    TMDB_LIMITER.acquire()
+    try:
+        details, errs = get_merged_details(client, tmdb_id, "movie")
+    except Exception:
+        return None, True
+    return details, False
+
+
 def main():
     api_key = os.getenv("TMDB_API_KEY")
     if not api_key:
@@ -66,14 +76,14 @@ def main():
     # Load existing database to preserve any manually added titles
     existing_db = {"version": "1.0", "titles": []}
     if os.path.exists(OUTPUT_FILE):
-        with open(OUTPUT_FILE, "r") as f:
-            existing_db = json.load(f)
+        with open(OUTPUT_FILE, "rb") as f:
+            existing_db = orjson.loads(f.read())
 
     # Track existing TMDb IDs to avoid duplicates
-    existing_ids = {t.get("tmdb_id") for t in existing_db.get("titles", [])}
+    all_titles = existing_db.pop("titles", [])
+    existing_ids = {t.get("tmdb_id") for t in all_titles}
     print(f"Existing database has {len(existing_ids)} titles")
 
-    all_titles = list(existing_db.get("titles", []))
     new_count = 0
     skipped_no_budget = 0
     errors = 0
@@ -81,6 +91,8 @@ def main():
     print(f"\nFetching movies from {START_YEAR} to {END_YEAR}...")
     print("=" * 60)
 
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
     for year in range(START_YEAR, END_YEAR + 1):
         year_titles = 0
         print(f"\n{year}:", end=" ")
@@ -90,23 +102,22 @@ def main():
                 break
 
             try:
+                TMDB_LIMITER.acquire()
                 movies = discover_movies_by_year(client, year, page)
                 if not movies:
                     break
 
-                for movie in movies:
-                    if year_titles >= MOVIES_PER_YEAR:
-                        break
-
-                    tmdb_id = movie.get("id")
-                    if tmdb_id in existing_ids:
-                        continue
-
-                    # Get full details
-                    time.sleep(RATE_LIMIT_DELAY)
-                    try:
-                        details, errs = get_merged_details(client, tmdb_id, "movie")
-                        if details and details.get("budget_raw") and details["budget_raw"] > 0:
+                tmdb_ids = [m.get("id") for m in movies if m.get("id") not in existing_ids]
+
+                # Get full details concurrently, at most the remaining quota at a time, in page order
+                while tmdb_ids and year_titles < MOVIES_PER_YEAR:
+                    batch = tmdb_ids[:MOVIES_PER_YEAR - year_titles]
+                    del tmdb_ids[:len(batch)]
+                    results = executor.map(lambda tmdb_id: fetch_movie(client, tmdb_id), batch)
+                    for tmdb_id, (details, failed) in zip(batch, results):
+                        if failed:
+                            errors += 1
+                        elif details and details.get("budget_raw") and details["budget_raw"] > 0:
                             all_titles.append(details)
                             existing_ids.add(tmdb_id)
                             year_titles += 1
@@ -114,8 +125,6 @@ def main():
                             print(".", end="", flush=True)
                         else:
                             skipped_no_budget += 1
-                    except Exception as e:
-                        errors += 1
 
             except Exception as e:
                 print(f"\nError fetching page {page} for {year}: {e}")
@@ -123,6 +132,8 @@ def main():
 
         print(f" ({year_titles} titles)")
 
+    executor.shutdown()
+
     # Save updated database
     output_db = {
         "version": "1.0",
@@ -130,8 +141,8 @@ def main():
         "titles": all_titles,
     }
 
-    with open(OUTPUT_FILE, "w") as f:
-        json.dump(output_db, f, indent=2)
+    with open(OUTPUT_FILE, "wb") as f:
+        f.write(orjson.dumps(output_db, option=orjson.OPT_INDENT_2))
 
     print("\n" + "=" * 60)
     print(f"DONE!")
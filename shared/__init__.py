@@ -0,0 +1,3 @@
+from .clients import get_secret, hash_key, get_tmdb_client
+from .chrome import inject_analytics, render_feedback_bar
+from .assets import load_asset, load_css, get_icon_uris
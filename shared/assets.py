@@ -0,0 +1,53 @@
+"""
+Static assets (CSS, SVG icons) read from assets/ and cached per server process.
+"""
+import os
+import re
+import base64
+
+import streamlit as st
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+
+
+@st.cache_data(show_spinner=False)
+def load_asset(name: str) -> str:
+    """Read a static asset (CSS/SVG) from assets/ once per server process."""
+    with open(os.path.join(ASSETS_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE_RE = re.compile(r"\s+")
+# Whitespace that is never significant: around braces, semicolons and commas, and after colons
+_CSS_PUNCT_RE = re.compile(r"\s*([{};,])\s*|:\s+")
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet."""
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_SPACE_RE.sub(" ", css)
+    css = _CSS_PUNCT_RE.sub(lambda m: m.group(1) or ":", css)
+    return css.replace(";}", "}").strip()
+
+
+@st.cache_data(show_spinner=False)
+def load_css(name: str) -> str:
+    """Read and minify a stylesheet from assets/ once per server process."""
+    return minify_css(load_asset(name))
+
+
+def svg_to_data_uri(svg_string):
+    """Convert SVG string to base64 data URI for reliable rendering."""
+    b64 = base64.b64encode(svg_string.encode('utf-8')).decode('utf-8')
+    return f"data:image/svg+xml;base64,{b64}"
+
+
+@st.cache_data(show_spinner=False)
+def get_icon_uris() -> dict:
+    """Encode the SVG icons once; page scripts rerun on every interaction."""
+    return {
+        "search": svg_to_data_uri(load_asset("icons/search.svg")),
+        "dollar": svg_to_data_uri(load_asset("icons/dollar.svg")),
+        "check": svg_to_data_uri(load_asset("icons/check.svg")),
+    }
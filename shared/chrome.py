@@ -0,0 +1,71 @@
+"""
+Page chrome shared by the app pages: Google Analytics and the feedback bar.
+"""
+import streamlit as st
+
+# Google Analytics
+GA_TRACKING_CODE = """
+<!-- Google tag (gtag.js) -->
+<script async src="https://www.googletagmanager.com/gtag/js?id=G-7J88HTR1H2"></script>
+<script>
+  window.dataLayer = window.dataLayer || [];
+  function gtag(){dataLayer.push(arguments);}
+  gtag('js', new Date());
+  gtag('config', 'G-7J88HTR1H2');
+</script>
+"""
+
+# Floating Feedback Bar (sub-pages; the home page styles its own in assets/home.css)
+FEEDBACK_BAR = """
+<style>
+.feedback-bar {
+    position: fixed;
+    bottom: 0;
+    left: 0;
+    width: 100%;
+    background: linear-gradient(90deg, #1e3a5f 0%, #2d5a87 100%);
+    padding: 12px 20px;
+    display: flex;
+    justify-content: center;
+    align-items: center;
+    gap: 15px;
+    z-index: 9999;
+    box-shadow: 0 -2px 10px rgba(0,0,0,0.2);
+}
+.feedback-bar p {
+    color: white;
+    margin: 0;
+    font-size: 14px;
+}
+.feedback-bar a {
+    background: #ff6b6b;
+    color: white;
+    padding: 8px 20px;
+    border-radius: 20px;
+    text-decoration: none;
+    font-weight: bold;
+    font-size: 14px;
+    transition: background 0.3s;
+}
+.feedback-bar a:hover {
+    background: #ff5252;
+}
+</style>
+<div class="feedback-bar">
+    <p>💡 Help us improve this tool!</p>
+    <a href="https://docs.google.com/forms/d/e/1FAIpQLSeD9j4-d0kVdt_UhT0etGqislY-Ue79PllVf9-akGLRu0r--A/viewform" target="_blank">Give Feedback</a>
+</div>
+"""
+
+
+def inject_analytics(page: str) -> None:
+    """Inject the GA tag into the page itself (no iframe), once per session per page."""
+    key = f"ga_sent_{page}"
+    if key not in st.session_state:
+        st.html(GA_TRACKING_CODE, unsafe_allow_javascript=True)
+        st.session_state[key] = True
+
+
+def render_feedback_bar() -> None:
+    """Render the floating feedback bar pinned to the bottom of the page."""
+    st.markdown(FEEDBACK_BAR, unsafe_allow_html=True)
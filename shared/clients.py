@@ -0,0 +1,28 @@
+"""
+Streamlit-side factories shared by the app pages.
+"""
+import os
+import hashlib
+
+import streamlit as st
+
+from api import TMDbClient
+
+
+def get_secret(key: str, default: str = "") -> str:
+    """Get secret from st.secrets (Streamlit Cloud) or environment (local dev)."""
+    try:
+        return st.secrets[key]
+    except (KeyError, FileNotFoundError, AttributeError):
+        return os.getenv(key, default)
+
+
+def hash_key(api_key: str) -> str:
+    """Short digest of the API key, so cache keys never hold it in plaintext."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+@st.cache_resource
+def get_tmdb_client(api_key: str) -> TMDbClient:
+    """One TMDb client (and pooled session) shared across reruns, pages and users."""
+    return TMDbClient(api_key)
@@ -1 +1 @@
-from .matching import find_comparable_titles, compute_similarity
+from .matching import TitleTable, find_comparable_titles, compute_similarity
@@ -7,13 +7,19 @@ Scoring uses a baseline + bonus/penalty system:
 - Produces scores ranging ~30-100 for meaningful differentiation
 """
 
+import bisect
+from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
+
 # Genre mapping from dropdown options to TMDb genre names
 GENRE_MAP = {
-    "Action/Adventure": ["Action", "Adventure"],
-    "Drama": ["Drama"],
-    "Comedy": ["Comedy"],
-    "Horror/Thriller": ["Horror", "Thriller"],
-    "Sci-Fi/Fantasy": ["Science Fiction", "Fantasy"],
+    "Action/Adventure": frozenset({"Action", "Adventure"}),
+    "Drama": frozenset({"Drama"}),
+    "Comedy": frozenset({"Comedy"}),
+    "Horror/Thriller": frozenset({"Horror", "Thriller"}),
+    "Sci-Fi/Fantasy": frozenset({"Science Fiction", "Fantasy"}),
 }
 
 # Scale tiers in order (for adjacency matching)
@@ -33,6 +39,23 @@ ADJACENCY = {
     "star_power": ["A-List", "B-List", "Rising Stars", "Ensemble/Unknown"],
 }
 
+# Position of each value within its ordered scale, so distances are one dict lookup
+SCALE_TIER_INDEX = {tier: i for i, tier in enumerate(SCALE_TIERS)}
+ADJACENCY_INDEX = {attr: {v: i for i, v in enumerate(order)} for attr, order in ADJACENCY.items()}
+
+
+def _score_table(size: int, steps: tuple, default):
+    """Square table scoring positions i, j by steps[|i - j|], or default when further apart."""
+    return tuple(
+        tuple(steps[abs(i - j)] if abs(i - j) < len(steps) else default for j in range(size))
+        for i in range(size)
+    )
+
+
+# Precomputed scores by position: exact, adjacent, two steps away
+SCALE_SCORES = _score_table(len(SCALE_TIERS), (100, 50), 0)
+DISTANCE_SCORES = {attr: _score_table(len(order), (1.0, 0.6, 0.3), 0.0) for attr, order in ADJACENCY.items()}
+
 # Country mapping from dropdown options to TMDb production country names
 COUNTRY_MAP = {
     "USA (Hollywood)": ["United States of America"],
@@ -42,6 +65,13 @@ COUNTRY_MAP = {
     "Asia/Other": [],  # Match anything not in above categories
 }
 
+COUNTRY_SETS = {region: frozenset(countries) for region, countries in COUNTRY_MAP.items()}
+# Every country in a named region; "Asia/Other" matches titles whose primary country is not one
+WESTERN_COUNTRIES = frozenset().union(*(c for region, c in COUNTRY_SETS.items() if region != "Asia/Other"))
+ENGLISH_SPEAKING = frozenset({"United States of America", "United Kingdom", "Canada", "Australia"})
+# Regions that include an English-speaking country, eligible for the partial English-language match
+ENGLISH_REGIONS = frozenset(region for region, c in COUNTRY_SETS.items() if c & ENGLISH_SPEAKING)
+
 # Runtime tier boundaries (minutes)
 RUNTIME_TIERS = {
     "Short": (0, 90),
@@ -50,14 +80,25 @@ RUNTIME_TIERS = {
     "Epic": (150, 999),
 }
 
+# The tiers are contiguous, so a runtime's tier is found by bisecting their boundaries
+RUNTIME_TIER_INDEX = {tier: i for i, tier in enumerate(RUNTIME_TIERS)}
+RUNTIME_BOUNDS = [low for low, _ in RUNTIME_TIERS.values()] + [RUNTIME_TIERS["Epic"][1]]
+RUNTIME_SCORES = _score_table(len(RUNTIME_TIERS), (1.0, 0.5), 0.0)
+
+
+@lru_cache(maxsize=64)
+def scale_tier(scale: str) -> str:
+    """Tier name of a scale label (e.g., "Blockbuster ($100M+)" -> "Blockbuster")."""
+    return scale.split(" (", 1)[0] if scale else ""
+
 
 def matches_genre(user_genre: str, title_genres: list) -> bool:
     """Check if user's selected genre matches any of the title's genres."""
     if not title_genres:
         return False
 
-    target_genres = GENRE_MAP.get(user_genre, [])
-    return any(g in target_genres for g in title_genres)
+    target_genres = GENRE_MAP.get(user_genre, frozenset())
+    return not target_genres.isdisjoint(title_genres)
 
 
 def match_scale(user_scale: str, title_scale: str) -> float:
@@ -68,23 +109,18 @@ def match_scale(user_scale: str, title_scale: str) -> float:
     if not title_scale:
         return 0
 
-    # Extract tier name from title_scale (e.g., "Blockbuster ($100M+)" -> "Blockbuster")
-    title_tier = title_scale.split(" (")[0] if title_scale else ""
-    user_tier = user_scale.split(" (")[0] if user_scale else ""
+    title_tier = scale_tier(title_scale)
+    user_tier = scale_tier(user_scale)
 
     if title_tier == user_tier:
         return 100
 
     # Check adjacency
-    try:
-        user_idx = SCALE_TIERS.index(user_tier)
-        title_idx = SCALE_TIERS.index(title_tier)
-        if abs(user_idx - title_idx) == 1:
-            return 50
-    except ValueError:
-        pass
-
-    return 0
+    user_idx = SCALE_TIER_INDEX.get(user_tier)
+    title_idx = SCALE_TIER_INDEX.get(title_tier)
+    if user_idx is None or title_idx is None:
+        return 0
+    return SCALE_SCORES[user_idx][title_idx]
 
 
 def get_distance_score(attr: str, val1: str, val2: str) -> float:
@@ -95,22 +131,15 @@ def get_distance_score(attr: str, val1: str, val2: str) -> float:
     if val1 == val2:
         return 1.0
 
-    if attr not in ADJACENCY:
+    index = ADJACENCY_INDEX.get(attr)
+    if index is None:
         return 0.0
 
-    order = ADJACENCY[attr]
-    try:
-        idx1 = order.index(val1)
-        idx2 = order.index(val2)
-        distance = abs(idx1 - idx2)
-        if distance == 1:
-            return 0.6  # Adjacent
-        elif distance == 2:
-            return 0.3  # Two steps away
-        else:
-            return 0.0  # Too far
-    except ValueError:
+    idx1 = index.get(val1)
+    idx2 = index.get(val2)
+    if idx1 is None or idx2 is None:
         return 0.0
+    return DISTANCE_SCORES[attr][idx1][idx2]
 
 
 def is_adjacent(attr: str, val1: str, val2: str) -> bool:
@@ -126,31 +155,25 @@ def match_country(user_country: str, title_countries: list) -> float:
     if not title_countries:
         return 0.0
 
-    expected = COUNTRY_MAP.get(user_country, [])
-
     # "Asia/Other" matches anything not in the Western categories
     # Primary country (first listed) must be non-western
     if user_country == "Asia/Other":
-        western = set()
-        for key, vals in COUNTRY_MAP.items():
-            if key != "Asia/Other":
-                western.update(vals)
-        primary = title_countries[0]
-        if primary not in western:
+        if title_countries[0] not in WESTERN_COUNTRIES:
             return 1.0
         return 0.0
 
+    expected = COUNTRY_SETS.get(user_country, frozenset())
+
     # Exact region match (primary country must be in expected list)
     if title_countries[0] in expected:
         return 1.0
 
     # Any country in expected list = partial match
-    if any(c in expected for c in title_countries):
+    if not expected.isdisjoint(title_countries):
         return 0.5
 
     # Partial: English-speaking countries are somewhat similar
-    english_speaking = {"United States of America", "United Kingdom", "Canada", "Australia"}
-    if expected and set(expected) & english_speaking and set(title_countries) & english_speaking:
+    if user_country in ENGLISH_REGIONS and not ENGLISH_SPEAKING.isdisjoint(title_countries):
         return 0.3
 
     return 0.0
@@ -169,36 +192,144 @@ def match_runtime(user_runtime: str, title_runtime) -> float:
     except (ValueError, TypeError):
         return 0.0
 
-    # Determine title's tier
-    title_tier = None
-    for tier, (low, high) in RUNTIME_TIERS.items():
-        if low <= runtime_min < high:
-            title_tier = tier
-            break
+    # Determine title's tier (-1 or len(RUNTIME_TIERS) when outside every tier)
+    title_idx = bisect.bisect_right(RUNTIME_BOUNDS, runtime_min) - 1
+    if not 0 <= title_idx < len(RUNTIME_TIERS):
+        return 0.0
 
-    if not title_tier:
+    user_idx = RUNTIME_TIER_INDEX.get(user_runtime)
+    if user_idx is None:
         return 0.0
+    return RUNTIME_SCORES[user_idx][title_idx]
+
+
+# Attribute weights: (bonus for match, penalty for mismatch)
+WEIGHTS = {
+    "genre":      {"bonus": 12, "penalty": -10},
+    "scale":      {"bonus": 10, "penalty": -8},
+    "vfx":        {"bonus": 6,  "penalty": -5},
+    "action":     {"bonus": 6,  "penalty": -5},
+    "period":     {"bonus": 6,  "penalty": -5},
+    "star_power": {"bonus": 4,  "penalty": -3},
+    "country":    {"bonus": 4,  "penalty": -3},
+    "runtime":    {"bonus": 4,  "penalty": -3},
+}
 
-    if user_runtime == title_tier:
-        return 1.0
 
-    # Check adjacency
-    tier_order = ["Short", "Standard", "Long", "Epic"]
-    try:
-        user_idx = tier_order.index(user_runtime)
-        title_idx = tier_order.index(title_tier)
-        if abs(user_idx - title_idx) == 1:
-            return 0.5
-    except ValueError:
-        pass
+def _points(dimension: str, partial: float) -> tuple:
+    """(bonus, partial bonus, penalty) for a dimension, computed from WEIGHTS."""
+    weights = WEIGHTS[dimension]
+    return weights["bonus"], weights["bonus"] * partial, weights["penalty"]
 
-    return 0.0
+
+# WEIGHTS flattened to plain constants, partial-credit multiples included
+GENRE_BONUS, GENRE_PARTIAL, GENRE_PENALTY = _points("genre", 0.3)
+SCALE_BONUS, SCALE_PARTIAL, SCALE_PENALTY = _points("scale", 0.3)
+COUNTRY_BONUS, COUNTRY_PARTIAL, COUNTRY_PENALTY = _points("country", 0.3)
+RUNTIME_BONUS, RUNTIME_PARTIAL, RUNTIME_PENALTY = _points("runtime", 0.3)
+
+# Distance-based attributes and the title field each one is read from
+DISTANCE_ATTRS = {
+    "vfx": "computed_vfx",
+    "action": "computed_action",
+    "period": "computed_period",
+    "star_power": "computed_star_power",
+}
+
+# Per distance attribute: (bonus, near bonus, near penalty, penalty, missing-data penalty)
+DISTANCE_POINTS = {
+    attr: (
+        WEIGHTS[attr]["bonus"],
+        WEIGHTS[attr]["bonus"] * 0.4,
+        WEIGHTS[attr]["penalty"] * 0.4,
+        WEIGHTS[attr]["penalty"],
+        WEIGHTS[attr]["penalty"] * 0.3,
+    )
+    for attr in DISTANCE_ATTRS
+}
+
+# Reason labels for the distance attributes (e.g., "star_power" -> "Star Power")
+DISTANCE_LABELS = {attr: attr.replace("_", " ").title() for attr in DISTANCE_ATTRS}
+
+# Genres that count as a partial match for each dropdown genre
+RELATED_GENRES = {
+    "Action/Adventure": frozenset({"Thriller", "Science Fiction"}),
+    "Drama": frozenset({"Romance", "Crime"}),
+    "Horror/Thriller": frozenset({"Mystery", "Crime"}),
+    "Sci-Fi/Fantasy": frozenset({"Adventure", "Action"}),
+}
+
+
+def genre_points(user_genre: str, title_genres) -> tuple[float, str | None]:
+    """Score contribution and reason for the genre dimension."""
+    if matches_genre(user_genre, title_genres):
+        return GENRE_BONUS, f"Genre: {title_genres[0]}"
+    if title_genres and not RELATED_GENRES.get(user_genre, frozenset()).isdisjoint(title_genres):
+        return GENRE_PARTIAL, f"Genre: ~{title_genres[0]}"
+    return GENRE_PENALTY, None
 
 
-def compute_similarity(user_attrs: dict, title: dict) -> tuple[float, list]:
+def scale_points(user_scale: str, title_scale: str) -> tuple[float, str | None]:
+    """Score contribution and reason for the production scale dimension."""
+    scale_score = match_scale(user_scale, title_scale)
+    if scale_score == 100:
+        return SCALE_BONUS, f"Scale: {scale_tier(title_scale)}"
+    if scale_score == 50:
+        return SCALE_PARTIAL, f"Scale: ~{scale_tier(title_scale)}"
+    return SCALE_PENALTY, None
+
+
+def distance_points(attr: str, user_val: str, title_val: str) -> tuple[float, str | None]:
+    """Score contribution and reason for a distance-based attribute (vfx, action, period, star_power)."""
+    bonus, near_bonus, near_penalty, penalty, missing = DISTANCE_POINTS[attr]
+    if not (user_val and title_val):
+        # No data - small penalty
+        return missing, None
+
+    dist = get_distance_score(attr, user_val, title_val)
+    if dist == 1.0:
+        return bonus, f"{DISTANCE_LABELS[attr]}: {title_val}"
+    elif dist >= 0.6:
+        return near_bonus, f"{DISTANCE_LABELS[attr]}: ~{title_val}"
+    elif dist >= 0.3:
+        return near_penalty, None
+    return penalty, None
+
+
+def country_points(user_country: str, title_countries) -> tuple[float, str | None]:
+    """Score contribution and reason for the production country dimension."""
+    country_score = match_country(user_country, title_countries)
+    if country_score == 1.0:
+        return COUNTRY_BONUS, f"Country: {title_countries[0]}" if title_countries else None
+    elif country_score >= 0.3:
+        return COUNTRY_PARTIAL, None
+    return COUNTRY_PENALTY, None
+
+
+def runtime_points(user_runtime: str, title_runtime) -> tuple[float, str | None]:
+    """Score contribution and reason for the runtime dimension."""
+    runtime_score = match_runtime(user_runtime, title_runtime)
+    if runtime_score == 1.0:
+        return RUNTIME_BONUS, f"Runtime: {title_runtime}min"
+    elif runtime_score >= 0.5:
+        return RUNTIME_PARTIAL, None
+    return RUNTIME_PENALTY, None
+
+
+# Recency bonus by age in years, clamped to 0-4 (future titles count as new)
+RECENCY_POINTS = (4, 4, 2, 1, 0)
+
+
+def recency_points(year: int, current_year: int) -> int:
+    """Recency bonus (up to 4 extra points) for recently released titles."""
+    return RECENCY_POINTS[min(max(current_year - year, 0), 4)]
+
+
+def compute_similarity(user_attrs: dict, title: dict, current_year: int = None) -> tuple[float, list]:
     """
     Compute similarity score between user-selected attributes and a database title.
     Returns (score 0-100, list of matching reasons).
+    current_year defaults to this year; callers scoring many titles pass it once.
 
     Uses baseline + bonus/penalty system for meaningful score differentiation:
     - Start at 50 (neutral baseline)
@@ -209,128 +340,27 @@ def compute_similarity(user_attrs: dict, title: dict) -> tuple[float, list]:
     score = 50  # Neutral baseline
     reasons = []
 
-    # Attribute weights: (bonus for match, penalty for mismatch)
-    weights = {
-        "genre":      {"bonus": 12, "penalty": -10},
-        "scale":      {"bonus": 10, "penalty": -8},
-        "vfx":        {"bonus": 6,  "penalty": -5},
-        "action":     {"bonus": 6,  "penalty": -5},
-        "period":     {"bonus": 6,  "penalty": -5},
-        "star_power": {"bonus": 4,  "penalty": -3},
-        "country":    {"bonus": 4,  "penalty": -3},
-        "runtime":    {"bonus": 4,  "penalty": -3},
-    }
-
-    # --- Genre matching ---
-    user_genre = user_attrs.get("genre", "")
-    title_genres = title.get("genres", [])
-    if matches_genre(user_genre, title_genres):
-        score += weights["genre"]["bonus"]
-        if title_genres:
-            reasons.append(f"Genre: {title_genres[0]}")
-    elif title_genres:
-        related = False
-        if user_genre == "Action/Adventure" and any(g in ["Thriller", "Science Fiction"] for g in title_genres):
-            related = True
-        elif user_genre == "Drama" and any(g in ["Romance", "Crime"] for g in title_genres):
-            related = True
-        elif user_genre == "Horror/Thriller" and any(g in ["Mystery", "Crime"] for g in title_genres):
-            related = True
-        elif user_genre == "Sci-Fi/Fantasy" and any(g in ["Adventure", "Action"] for g in title_genres):
-            related = True
-
-        if related:
-            score += weights["genre"]["bonus"] * 0.3
-            reasons.append(f"Genre: ~{title_genres[0]}")
-        else:
-            score += weights["genre"]["penalty"]
-    else:
-        score += weights["genre"]["penalty"]
-
-    # --- Scale matching ---
-    scale_score = match_scale(user_attrs.get("scale", ""), title.get("computed_scale", ""))
-    if scale_score == 100:
-        score += weights["scale"]["bonus"]
-        scale_display = title.get("computed_scale", "N/A").split(" (")[0]
-        reasons.append(f"Scale: {scale_display}")
-    elif scale_score == 50:
-        score += weights["scale"]["bonus"] * 0.3
-        scale_display = title.get("computed_scale", "N/A").split(" (")[0]
-        reasons.append(f"Scale: ~{scale_display}")
-    else:
-        score += weights["scale"]["penalty"]
-
-    # --- Distance-based attributes (vfx, action, period, star_power) ---
-    attr_map = {
-        "vfx": "computed_vfx",
-        "action": "computed_action",
-        "period": "computed_period",
-        "star_power": "computed_star_power",
-    }
-
-    for attr, title_key in attr_map.items():
-        user_val = user_attrs.get(attr, "")
-        title_val = title.get(title_key, "")
-
-        if user_val and title_val:
-            dist = get_distance_score(attr, user_val, title_val)
-            if dist == 1.0:
-                score += weights[attr]["bonus"]
-                reasons.append(f"{attr.replace('_', ' ').title()}: {title_val}")
-            elif dist >= 0.6:
-                score += weights[attr]["bonus"] * 0.4
-                reasons.append(f"{attr.replace('_', ' ').title()}: ~{title_val}")
-            elif dist >= 0.3:
-                score += weights[attr]["penalty"] * 0.4
-            else:
-                score += weights[attr]["penalty"]
-        else:
-            # No data - small penalty
-            score += weights[attr]["penalty"] * 0.3
-
-    # --- Country matching ---
+    def add(points, reason):
+        nonlocal score
+        score += points
+        if reason:
+            reasons.append(reason)
+
+    add(*genre_points(user_attrs.get("genre", ""), title.get("genres", [])))
+    add(*scale_points(user_attrs.get("scale", ""), title.get("computed_scale", "")))
+    for attr, title_key in DISTANCE_ATTRS.items():
+        add(*distance_points(attr, user_attrs.get(attr, ""), title.get(title_key, "")))
+
     user_country = user_attrs.get("country", "")
-    title_countries = title.get("production_countries", [])
     if user_country:
-        country_score = match_country(user_country, title_countries)
-        if country_score == 1.0:
-            score += weights["country"]["bonus"]
-            if title_countries:
-                reasons.append(f"Country: {title_countries[0]}")
-        elif country_score >= 0.3:
-            score += weights["country"]["bonus"] * 0.3
-        else:
-            score += weights["country"]["penalty"]
-
-    # --- Runtime matching ---
+        add(*country_points(user_country, title.get("production_countries", [])))
+
     user_runtime = user_attrs.get("runtime", "")
-    title_runtime = title.get("runtime")
     if user_runtime:
-        runtime_score = match_runtime(user_runtime, title_runtime)
-        if runtime_score == 1.0:
-            score += weights["runtime"]["bonus"]
-            reasons.append(f"Runtime: {title_runtime}min")
-        elif runtime_score >= 0.5:
-            score += weights["runtime"]["bonus"] * 0.3
-        else:
-            score += weights["runtime"]["penalty"]
-
-    # --- Recency bonus (up to 4 extra points) ---
-    release_date = title.get("release_date", "")
-    if release_date and len(release_date) >= 4:
-        try:
-            from datetime import datetime
-            year = int(release_date[:4])
-            current_year = datetime.now().year
-            years_old = current_year - year
-            if years_old <= 1:
-                score += 4
-            elif years_old <= 2:
-                score += 2
-            elif years_old <= 3:
-                score += 1
-        except ValueError:
-            pass
+        add(*runtime_points(user_runtime, title.get("runtime")))
+
+    # get_title_year() is 0 for missing dates, which earns no recency bonus
+    score += recency_points(get_title_year(title), current_year or datetime.now().year)
 
     # Clamp to 0-100
     score = max(0, min(100, score))
@@ -346,12 +376,8 @@ def filter_by_scale(user_scale: str, title_scale: str) -> bool:
     if not title_scale:
         return False
 
-    # Extract tier names (e.g., "Blockbuster ($100M+)" -> "Blockbuster")
-    user_tier = user_scale.split(" (")[0] if user_scale else ""
-    title_tier = title_scale.split(" (")[0] if title_scale else ""
-
     # Exact match only
-    return user_tier == title_tier
+    return scale_tier(user_scale) == scale_tier(title_scale)
 
 
 def get_title_year(title: dict) -> int:
@@ -365,45 +391,128 @@ def get_title_year(title: dict) -> int:
     return 0
 
 
-def find_comparable_titles(user_attrs: dict, titles: list, limit: int = 5, max_years: int = 6) -> list:
+def _encode(values: list) -> tuple[np.ndarray, list]:
+    """Encode a column as integer codes into its list of distinct values."""
+    index = {}
+    codes = np.fromiter((index.setdefault(v, len(index)) for v in values), dtype=np.int32, count=len(values))
+    return codes, list(index)
+
+
+class TitleTable:
+    """
+    Column-wise (structure-of-arrays) view of the titles database.
+
+    Each attribute is stored as integer codes into its distinct values, so scoring
+    evaluates each distinct value once and gathers the result for every title with
+    a single NumPy lookup. Build it once per database load and reuse it across searches.
+    """
+
+    def __init__(self, titles: list):
+        self.titles = list(titles)
+        self.years = np.array([get_title_year(t) for t in self.titles], dtype=np.int32)
+        self.columns = {
+            "genres": _encode([tuple(t.get("genres", []) or ()) for t in self.titles]),
+            "scale": _encode([t.get("computed_scale", "") for t in self.titles]),
+            "country": _encode([tuple(t.get("production_countries", []) or ()) for t in self.titles]),
+            "runtime": _encode([t.get("runtime") for t in self.titles]),
+        }
+        for attr, title_key in DISTANCE_ATTRS.items():
+            self.columns[attr] = _encode([t.get(title_key, "") for t in self.titles])
+        # Per-dimension point tables, keyed by the user value(s) they were built for
+        self._points = {}
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def lookup(self, column: str, fn, rows: np.ndarray) -> np.ndarray:
+        """Apply fn to each distinct value of a column and gather the results for the given rows."""
+        codes, uniques = self.columns[column]
+        return np.array([fn(v) for v in uniques], dtype=np.float64)[codes[rows]]
+
+    def points(self, column: str, rows: np.ndarray, points_fn, *args) -> np.ndarray:
+        """
+        Points from points_fn(*args, value) for the given rows.
+
+        The per-value table only depends on the user's choice for this one dimension,
+        so it is built once per choice and reused when other attributes change.
+        """
+        key = (column, points_fn, args)
+        table = self._points.get(key)
+        if table is None:
+            _, uniques = self.columns[column]
+            table = self._points[key] = np.array([points_fn(*args, v)[0] for v in uniques], dtype=np.float64)
+        return table[self.columns[column][0][rows]]
+
+    def scores(self, user_attrs: dict, rows: np.ndarray, current_year: int = None) -> np.ndarray:
+        """Vectorized compute_similarity scores (without reasons) for the given rows."""
+        # Same dimensions, added in the same order, as compute_similarity
+        score = np.full(len(rows), 50.0)
+        score += self.points("genres", rows, genre_points, user_attrs.get("genre", ""))
+        score += self.points("scale", rows, scale_points, user_attrs.get("scale", ""))
+        for attr in DISTANCE_ATTRS:
+            score += self.points(attr, rows, distance_points, attr, user_attrs.get(attr, ""))
+
+        user_country = user_attrs.get("country", "")
+        if user_country:
+            score += self.points("country", rows, country_points, user_country)
+
+        user_runtime = user_attrs.get("runtime", "")
+        if user_runtime:
+            score += self.points("runtime", rows, runtime_points, user_runtime)
+
+        # get_title_year() is 0 for missing dates, which earns no recency bonus
+        years_old = (current_year or datetime.now().year) - self.years[rows]
+        score += np.take(RECENCY_POINTS, np.clip(years_old, 0, 4))
+
+        return np.clip(score, 0, 100)
+
+
+def find_comparable_titles(user_attrs: dict, titles, limit: int = 5, max_years: int = 6) -> list:
     """
     Find top N most similar titles from database.
 
     Args:
         user_attrs: Dict with keys: genre, scale, vfx, action, period, star_power
-        titles: List of title dicts from database
+        titles: List of title dicts from database, or a prebuilt TitleTable
         limit: Max number of results to return
         max_years: Only include titles from the last N years (default 6, per industry standard)
 
     Returns:
         List of dicts with keys: title, score, reasons
     """
-    from datetime import datetime
+    table = titles if isinstance(titles, TitleTable) else TitleTable(titles)
+
     current_year = datetime.now().year
     min_year = current_year - max_years  # e.g., 2024 - 6 = 2018, so 2019+ included
 
-    user_scale = user_attrs.get("scale", "")
+    # HARD FILTER 1: Only titles from last 6 years
+    rows = np.flatnonzero(table.years >= min_year)
 
-    scored = []
-    for title in titles:
-        # HARD FILTER 1: Only titles from last 6 years
-        title_year = get_title_year(title)
-        if title_year < min_year:
-            continue
-
-        # HARD FILTER 2: Scale must match exact tier
-        title_scale = title.get("computed_scale", "")
-        if not filter_by_scale(user_scale, title_scale):
-            continue
-
-        score, reasons = compute_similarity(user_attrs, title)
-        if score > 0:  # Only include titles with some match
-            scored.append({
-                "title": title,
-                "score": score,
-                "reasons": reasons
-            })
-
-    # Sort by score descending
-    scored.sort(key=lambda x: x["score"], reverse=True)
-    return scored[:limit]
+    # HARD FILTER 2: Scale must match exact tier
+    user_scale = user_attrs.get("scale", "")
+    rows = rows[table.lookup("scale", lambda v: filter_by_scale(user_scale, v), rows).astype(bool)]
+
+    scores = table.scores(user_attrs, rows, current_year)
+    keep = scores > 0  # Only include titles with some match
+    rows, scores = rows[keep], scores[keep]
+
+    if 0 < limit < len(scores):
+        # Only the top `limit` are needed: keep rows scoring at least the limit-th best
+        # (ties included, still in database order) and sort just those
+        kth = np.partition(scores, len(scores) - limit)[len(scores) - limit]
+        keep = scores >= kth
+        rows, scores = rows[keep], scores[keep]
+
+    # Sort by score descending; a stable sort keeps database order among ties
+    top = rows[np.argsort(-scores, kind="stable")[:limit]]
+
+    results = []
+    for i in top:
+        title = table.titles[i]
+        score, reasons = compute_similarity(user_attrs, title, current_year)
+        results.append({
+            "title": title,
+            "score": score,
+            "reasons": reasons
+        })
+    return results